@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Entries held in the in-process LRU tier
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "100000"))
+
+# On-disk tier; an empty path keeps the cache in memory only
+ANALYSIS_CACHE_PATH = os.getenv("ANALYSIS_CACHE_PATH", "./data/analysis_cache.sqlite3")
+
+# Rows kept on disk; the least recently used are evicted beyond this
+ANALYSIS_CACHE_MAX_ROWS = int(os.getenv("ANALYSIS_CACHE_MAX_ROWS", "2000000"))
+
+# Writes and recency updates buffered before they are committed in one transaction
+FLUSH_EVERY = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+
+def lexicon_version(*lexicons):
+    """Short fingerprint of the lexicons scoring depends on; any edit yields a new version."""
+    payload = json.dumps(lexicons, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+def cache_key(text, source, lexicon, analyzer):
+    """
+    Hash of everything an analysis result depends on.
+
+    Whitespace is collapsed but case is kept, since VADER scores
+    capitalized words differently.
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip()
+    material = "\x1f".join((normalized, (source or "").strip(), lexicon, analyzer))
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=16).digest()
+
+class AnalysisCache:
+    """
+    Two-tier memo of analysis results: a bounded in-process LRU over a SQLite file.
+
+    Results are looked up in memory first, then on disk (promoting the
+    hit into memory). New results and disk hits are buffered and
+    committed every FLUSH_EVERY operations and on ``flush``, which also
+    evicts the least recently used rows beyond ``max_rows``. Keys embed
+    the lexicon and analyzer versions, so stale entries are never hit
+    and simply age out.
+    """
+
+    def __init__(self, path=ANALYSIS_CACHE_PATH, size=ANALYSIS_CACHE_SIZE, max_rows=ANALYSIS_CACHE_MAX_ROWS):
+        self.size = size
+        self.max_rows = max_rows
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending_writes = {}
+        self._pending_touches = set()
+        self.hits = 0
+        self.misses = 0
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis ("
+                "key BLOB PRIMARY KEY, result TEXT NOT NULL, used_at INTEGER NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS analysis_used_at ON analysis (used_at)")
+            self._db.commit()
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.size:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached result for ``key``, or None."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+            result = self._pending_writes.get(key)
+            if result is None and self._db is not None:
+                row = self._db.execute("SELECT result FROM analysis WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    result = json.loads(row[0])
+                    self._pending_touches.add(key)
+                    self._maybe_flush()
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, result)
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._remember(key, result)
+            if self._db is not None:
+                self._pending_writes[key] = result
+                self._maybe_flush()
+
+    def _maybe_flush(self):
+        if len(self._pending_writes) + len(self._pending_touches) >= FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self):
+        now = int(time.time())
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO analysis (key, result, used_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(result), now) for key, result in self._pending_writes.items()],
+            )
+            self._db.executemany(
+                "UPDATE analysis SET used_at = ? WHERE key = ?",
+                [(now, key) for key in self._pending_touches],
+            )
+        self._pending_writes.clear()
+        self._pending_touches.clear()
+
+    def _evict(self):
+        (rows,) = self._db.execute("SELECT COUNT(*) FROM analysis").fetchone()
+        if rows > self.max_rows:
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM analysis WHERE key IN "
+                    "(SELECT key FROM analysis ORDER BY used_at LIMIT ?)",
+                    (rows - self.max_rows,),
+                )
+
+    def flush(self):
+        """Commit buffered results and recency updates, then evict beyond ``max_rows``."""
+        if self._db is None:
+            return
+        with self._lock:
+            self._flush()
+            self._evict()
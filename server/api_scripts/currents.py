@@ -1,10 +1,15 @@
-import requests
+from api_scripts import http_client
 
-def fetch_currents_news(api_key, query):
-    url = f"https://api.currentsapi.services/v1/search?apiKey={api_key}&keywords={query}"
-    response = requests.get(url)
+CURRENTS_URL = "https://api.currentsapi.services/v1/search"
+
+def fetch_currents_news(api_key, query, since=None, url=CURRENTS_URL):
+    params = {"apiKey": api_key, "keywords": query}
+    if since:
+        params["start_date"] = since.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    response = http_client.get(url, params=params)
     if response.status_code == 200:
-        articles = response.json().get("articles", [])
+        data = response.json()
+        articles = data.get("news") or data.get("articles", [])  # Currents returns results under 'news'
         print(f"Fetched {len(articles)} articles from CurrentAPI.")
         return articles
     else:
@@ -0,0 +1,121 @@
+import os
+import threading
+
+import feedparser
+
+from api_scripts import http_client
+from api_scripts.state_store import load_state, save_state
+
+# Where per-feed ETag / Last-Modified validators are kept between runs
+VALIDATOR_STORE_PATH = os.getenv("FEED_VALIDATOR_STORE", "./data/feed_validators.json")
+
+class FeedValidatorStore:
+    """
+    Persistent map of feed URL to the HTTP validators from its last response.
+
+    Validators from new downloads stay pending until ``save``, which the
+    pipeline calls once the cycle's articles have been fully processed,
+    alongside the cursors and seen-URL store. Until then ``get`` returns
+    the committed validators, so a feed whose entries were never parsed,
+    analyzed or uploaded is downloaded in full again instead of answering
+    304 Not Modified.
+    """
+
+    def __init__(self, path=VALIDATOR_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._validators = load_state(path)
+        self._pending = {}
+
+    def get(self, feed_url):
+        with self._lock:
+            return dict(self._validators.get(feed_url, {}))
+
+    def update(self, feed_url, etag=None, modified=None):
+        validators = {key: value for key, value in (("etag", etag), ("modified", modified)) if value}
+        with self._lock:
+            self._pending[feed_url] = validators
+
+    def discard(self, feed_url):
+        """Drop a feed's pending validators, e.g. when its body could not be parsed."""
+        with self._lock:
+            self._pending.pop(feed_url, None)
+
+    def save(self):
+        """Commit the pending validators and write them to disk."""
+        with self._lock:
+            if not self._pending:
+                return
+            for feed_url, validators in self._pending.items():
+                if validators:
+                    self._validators[feed_url] = validators
+                else:
+                    self._validators.pop(feed_url, None)
+            self._pending.clear()
+            save_state(self.path, self._validators)
+
+    def rollback(self):
+        """Drop every pending validator, so the next poll downloads those feeds again."""
+        with self._lock:
+            self._pending.clear()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_validator_store():
+    """Return the shared validator store, loading it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FeedValidatorStore()
+    return _store
+
+def conditional_headers(validators):
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+    return headers
+
+def download_feed(feed_url, store=None):
+    """
+    Download a feed's raw bytes with a conditional GET, without parsing it.
+
+    Args:
+        feed_url (str): URL of the RSS/Atom feed
+        store (FeedValidatorStore, optional): Validator store, defaults to the shared one
+
+    Returns:
+        tuple or None: ``(content, headers)`` of the response, or None when
+        the server answered 304 Not Modified
+    """
+    store = store or get_validator_store()
+    response = http_client.get(feed_url, headers=conditional_headers(store.get(feed_url)))
+
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+
+    store.update(feed_url, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return response.content, dict(response.headers)
+
+def fetch_feed(feed_url, store=None):
+    """
+    Download and parse a feed with a conditional GET.
+
+    Args:
+        feed_url (str): URL of the RSS/Atom feed
+        store (FeedValidatorStore, optional): Validator store, defaults to the shared one
+
+    Returns:
+        feedparser.FeedParserDict or None: The parsed feed, or None when the
+        server answered 304 Not Modified and parsing was skipped
+    """
+    downloaded = download_feed(feed_url, store)
+    if downloaded is None:
+        return None
+    content, headers = downloaded
+    return feedparser.parse(content, response_headers=headers)
@@ -0,0 +1,135 @@
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import feedparser
+
+from api_scripts.feed_cache import download_feed, get_validator_store
+from api_scripts.res_scraper import feed_to_articles
+
+# JSON list of {"name": ..., "url": ...} feeds to crawl each cycle
+FEEDS_FILE = os.getenv("RSS_FEEDS_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), "rss_feeds.json"))
+
+# Downloads are network bound, parsing is CPU bound: size the two pools separately
+DOWNLOAD_WORKERS = 16
+PARSE_WORKERS = os.cpu_count() or 1
+
+def load_feed_list(path=FEEDS_FILE):
+    """Load the configured feeds as a list of {"name", "url"} dictionaries."""
+    with open(path, "r") as file:
+        return json.load(file)
+
+def _parse_feed_bytes(name, content, headers):
+    """Process-pool worker: parse raw feed bytes into plain, picklable article dicts."""
+    articles = feed_to_articles(feedparser.parse(content, response_headers=headers))
+    for article in articles:
+        article["feed"] = name
+    return articles
+
+_parser_pool = None
+_parser_pool_lock = threading.Lock()
+
+def get_parser_pool(workers=PARSE_WORKERS):
+    """
+    Return the process-wide feed parser pool, starting it on first use.
+
+    The pool outlives individual crawls, and its workers come from a
+    forkserver (spawn where that is unavailable) rather than a fork of
+    this process, which runs download and fetch-engine threads whose
+    locks a forked child could inherit held. ``workers`` only applies
+    when the pool is started.
+    """
+    global _parser_pool
+    if _parser_pool is None:
+        with _parser_pool_lock:
+            if _parser_pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                _parser_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    return _parser_pool
+
+def _reset_parser_pool(pool):
+    """Forget a broken parser pool so the next crawl starts a fresh one."""
+    global _parser_pool
+    with _parser_pool_lock:
+        if _parser_pool is pool:
+            _parser_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def iter_feed_articles(feeds, download_workers=DOWNLOAD_WORKERS, parse_workers=PARSE_WORKERS):
+    """
+    Crawl many feeds at once and merge their articles into one stream.
+
+    Feeds are downloaded concurrently (with conditional GETs, so unchanged
+    feeds cost neither bandwidth nor parsing) and each body is handed to the
+    shared parser process pool for feedparser as soon as it arrives.
+    Articles are yielded per feed in completion order. A failing feed is
+    logged and skipped.
+
+    Args:
+        feeds (list): Feed dictionaries with "name" and "url"
+        download_workers (int): Concurrent downloads
+        parse_workers (int): Parser processes, if this crawl starts the shared pool
+
+    Yields:
+        dict: Articles with title, link, summary, published and feed name
+    """
+    if not feeds:
+        return
+
+    parsers = get_parser_pool(parse_workers)
+    with ThreadPoolExecutor(max_workers=min(download_workers, len(feeds))) as downloads:
+        download_futures = {downloads.submit(download_feed, feed["url"]): feed for feed in feeds}
+        parse_futures = {}
+        pending = set(download_futures)
+        not_modified = 0
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in download_futures:
+                    feed = download_futures[future]
+                    try:
+                        downloaded = future.result()
+                    except Exception as e:
+                        print(f"Error fetching RSS feed {feed['name']}: {e}")
+                        continue
+                    if downloaded is None:
+                        not_modified += 1
+                        continue
+                    content, headers = downloaded
+                    try:
+                        parse_future = parsers.submit(_parse_feed_bytes, feed["name"], content, headers)
+                    except BrokenProcessPool:
+                        _reset_parser_pool(parsers)
+                        parsers = get_parser_pool(parse_workers)
+                        parse_future = parsers.submit(_parse_feed_bytes, feed["name"], content, headers)
+                    parse_futures[parse_future] = feed
+                    pending.add(parse_future)
+                else:
+                    try:
+                        yield from future.result()
+                    except Exception as e:
+                        feed = parse_futures[future]
+                        print(f"Error parsing RSS feed {feed['name']}: {e}")
+                        if isinstance(e, BrokenProcessPool):
+                            _reset_parser_pool(parsers)
+                        # Keep the old validators so the next crawl downloads this feed again
+                        get_validator_store().discard(feed["url"])
+
+    print(f"Crawled {len(feeds)} RSS feeds ({not_modified} not modified).")
+
+def crawl_feeds(feeds=None):
+    """Crawl the given feeds, or the configured feed list, and return all articles."""
+    feeds = load_feed_list() if feeds is None else feeds
+    articles = list(iter_feed_articles(feeds))
+    print(f"Fetched {len(articles)} articles from {len(feeds)} RSS feeds.")
+    return articles
+
+if __name__ == "__main__":
+    articles = crawl_feeds()
+    for article in articles[:5]:
+        print(article)
@@ -1,11 +1,192 @@
-import requests
+import codecs
+import json
+from datetime import datetime
 
-def fetch_gdelt_news(query):
-    url = f"https://api.gdeltproject.org/api/v2/doc/doc?query={query}&mode=artlist"
-    response = requests.get(url)
-    return response.text
+from api_scripts import http_client
+from api_scripts.pagination import CATCH_UP_MAX_PAGES
+from cursors import article_published
+
+GDELT_DOC_URL = "https://api.gdeltproject.org/api/v2/doc/doc"
+
+# The DOC API returns at most 250 records per request
+MAX_RECORDS = 250
+
+# Bytes read from the socket per parser step
+CHUNK_SIZE = 64 * 1024
+
+def iter_json_array(chunks, key):
+    """
+    Incrementally yield the objects of the top-level array stored under ``key``.
+
+    Only the current, partially received object is buffered, so memory
+    stays flat no matter how many records the response carries.
+
+    Args:
+        chunks (iterable): Text chunks of a JSON document, in order
+        key (str): Name of the array member to stream
+
+    Yields:
+        dict: Each element of the array as soon as it has been fully received
+    """
+    decoder = json.JSONDecoder()
+    marker = f'"{key}"'
+    buffer = ""
+    in_array = False
+
+    for chunk in chunks:
+        buffer += chunk
+        if not in_array:
+            start = buffer.find(marker)
+            if start == -1:
+                buffer = buffer[-len(marker):]
+                continue
+            bracket = buffer.find("[", start + len(marker))
+            if bracket == -1:
+                buffer = buffer[start:]
+                continue
+            buffer = buffer[bracket + 1:]
+            in_array = True
+
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element not fully received yet; wait for the next chunk
+                break
+            yield item
+        buffer = buffer[pos:]
+
+def _format_seendate(seendate):
+    """Convert GDELT's compact 20240131T154500Z timestamps to ISO 8601."""
+    try:
+        return datetime.strptime(seendate, "%Y%m%dT%H%M%SZ").strftime("%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return seendate
+
+def _gdelt_params(query, max_records, timespan, start, end):
+    params = {
+        "query": query,
+        "mode": "artlist",
+        "format": "json",
+        "sort": "datedesc",
+        "maxrecords": min(max_records, MAX_RECORDS),
+    }
+    if timespan:
+        params["timespan"] = timespan
+    if start:
+        params["startdatetime"] = start.strftime("%Y%m%d%H%M%S")
+    if end:
+        params["enddatetime"] = end.strftime("%Y%m%d%H%M%S")
+    return params
+
+def _iter_window(query, max_records, timespan=None, start=None, end=None, url=GDELT_DOC_URL):
+    response = http_client.get(url, params=_gdelt_params(query, max_records, timespan, start, end), stream=True)
+    response.raise_for_status()
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    chunks = (decoder.decode(chunk) for chunk in response.iter_content(CHUNK_SIZE))
+    try:
+        for record in iter_json_array(chunks, "articles"):
+            yield {
+                "title": record.get("title"),
+                "url": record.get("url"),
+                "domain": record.get("domain"),
+                "seendate": _format_seendate(record.get("seendate")),
+                "language": record.get("language"),
+                "sourcecountry": record.get("sourcecountry"),
+            }
+    finally:
+        response.close()
+
+def iter_gdelt_news(query, max_records=MAX_RECORDS, timespan=None, start=None, end=None, window=None, url=GDELT_DOC_URL):
+    """
+    Stream articles from the GDELT DOC API in structured JSON mode.
+
+    Records are parsed one at a time straight off the socket. Since a single
+    request is capped at 250 records, a larger batch can be pulled by giving
+    a ``start``/``end`` range and a ``window``: the range is walked one window
+    at a time, newest first, with up to ``max_records`` per window.
+
+    Args:
+        query (str): GDELT query string
+        max_records (int): Records per request, at most 250
+        timespan (str, optional): Relative window such as "15min", "24h" or "7d"
+        start (datetime, optional): Absolute window start (UTC)
+        end (datetime, optional): Absolute window end (UTC)
+        window (timedelta, optional): Slice size for walking ``start``..``end``
+        url (str): DOC API endpoint, as declared in the source registry
+
+    Yields:
+        dict: Articles with title, url, domain, seendate, language and sourcecountry
+    """
+    if not (window and start and end):
+        yield from _iter_window(query, max_records, timespan, start, end, url)
+        return
+
+    slice_end = end
+    while slice_end > start:
+        slice_start = max(start, slice_end - window)
+        yield from _iter_window(query, max_records, start=slice_start, end=slice_end, url=url)
+        slice_end = slice_start
+
+def iter_gdelt_since(query, since, max_records=MAX_RECORDS, max_requests=CATCH_UP_MAX_PAGES, url=GDELT_DOC_URL):
+    """
+    Stream every article seen after ``since``, walking back from now in capped requests.
+
+    Results come newest first and each request stops at ``max_records``,
+    so when a full response has not reached ``since`` the next request
+    ends at the oldest record received, until a record at or before
+    ``since`` shows up, a response comes back short or ``max_requests``
+    requests have been made. Records on a window boundary can arrive
+    twice; deduplication downstream drops the copy.
+
+    Args:
+        query (str): GDELT query string
+        since (datetime): High-water mark (UTC) to walk back to
+        max_records (int): Records per request, at most 250
+        max_requests (int): Maximum number of requests
+        url (str): DOC API endpoint
+
+    Yields:
+        dict: Articles as yielded by iter_gdelt_news
+    """
+    limit = min(max_records, MAX_RECORDS)
+    end = None
+    for _ in range(max_requests):
+        received = 0
+        oldest = None
+        reached = False
+        for article in _iter_window(query, max_records, start=since, end=end, url=url):
+            yield article
+            received += 1
+            published = article_published(article)
+            if published is not None:
+                reached = reached or published <= since
+                oldest = published if oldest is None or published < oldest else oldest
+        if reached or received < limit or oldest is None or (end is not None and oldest >= end):
+            return
+        end = oldest
+
+def fetch_gdelt_news(query, max_records=MAX_RECORDS, timespan=None, start=None, end=None, window=None, since=None, url=GDELT_DOC_URL):
+    if since and not (start or end or window):
+        # An absolute start replaces the relative timespan; walk back to it past the per-request cap
+        articles = list(iter_gdelt_since(query, since, max_records, url=url))
+    else:
+        if since and not start:
+            start, timespan = since, None
+        articles = list(iter_gdelt_news(query, max_records, timespan, start, end, window, url))
+    print(f"Fetched {len(articles)} articles from GDELT.")
+    return articles
 
 if __name__ == "__main__":
-    articles = fetch_gdelt_news("conflict")
+    articles = fetch_gdelt_news("conflict", timespan="24h")
     print(f"Fetched articles from GDELT API.")
-    print(articles)
+    for article in articles[:5]:
+        print(article)
@@ -1,10 +1,20 @@
-import feedparser
+from api_scripts.feed_cache import fetch_feed
+
+GOOGLE_NEWS_URL = "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en"
+
+def fetch_google_news_rss(url=GOOGLE_NEWS_URL):
+    feed = fetch_feed(url)
+    if feed is None:
+        print("Google News RSS not modified since last poll.")
+        return []
 
-def fetch_google_news_rss():
-    rss_url = "https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en"
-    feed = feedparser.parse(rss_url)
     articles = [
-        {"title": entry.title, "link": entry.link, "published": entry.published}
+        {
+            "title": entry.get("title"),
+            "link": entry.get("link"),
+            "published": entry.get("published"),
+            "source": entry.get("source", {}).get("title"),
+        }
         for entry in feed.entries
     ]
     return articles
@@ -0,0 +1,120 @@
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api_scripts import rate_limit, response_cache
+
+# Connect and read deadlines in seconds; a hung provider fails fast instead of stalling the run
+CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+DEFAULT_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+# Retry policy for throttled or failing upstreams
+MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Connection pool sizing: one pool per host, several keep-alive sockets per pool
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+USER_AGENT = "BiasLens/1.0 (+https://github.com/Hum2a/BiasLens)"
+
+# Send all provider traffic to a local mock server instead (see mock_providers.py)
+MOCK_PROVIDER_URL = os.getenv("MOCK_PROVIDER_URL")
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT, "Connection": "keep-alive"})
+                _session = session
+    return _session
+
+def _backoff_delay(attempt, response=None):
+    """
+    Compute how long to wait before the next attempt.
+
+    Honors a numeric Retry-After header when the server sends one, otherwise
+    uses full-jitter exponential backoff so concurrent callers spread out.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), BACKOFF_CAP)
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+def _route(url):
+    """Rewrite a provider URL to ``<mock>/<host>/<path>`` when a mock server is configured."""
+    if not MOCK_PROVIDER_URL:
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{MOCK_PROVIDER_URL.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+def get(url, params=None, headers=None, timeout=DEFAULT_TIMEOUT, max_retries=MAX_RETRIES, stream=False):
+    """
+    Perform a GET through the shared session with deadlines and retries.
+
+    Responses with a 429 or 5xx status, and connection errors or timeouts,
+    are retried with jittered exponential backoff. The last response is
+    returned as-is once retries run out, so callers keep their own status
+    handling; the last exception is re-raised if no response was received.
+
+    Every attempt first waits on the provider's token bucket and is charged
+    to its daily quota, raising QuotaExceededError once the quota is used up.
+
+    When HTTP_CACHE_MODE is set, the on-disk response cache sits in front of
+    all of this: cache hits skip the network, rate limits and quota entirely,
+    and successful responses are stored (reading the body even if ``stream``).
+
+    Args:
+        url (str): Request URL
+        params (dict, optional): Query string parameters
+        headers (dict, optional): Extra request headers
+        timeout (tuple): (connect, read) deadlines in seconds
+        max_retries (int): Number of retries after the first attempt
+        stream (bool): Defer downloading the body until it is read
+
+    Returns:
+        requests.Response: The final response
+    """
+    url = _route(url)
+    cached = response_cache.lookup(url, params)
+    if cached is not None:
+        return cached
+
+    session = get_session()
+    for attempt in range(max_retries + 1):
+        rate_limit.acquire(url)
+        try:
+            response = session.get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+            response_cache.store(url, params, response)
+            return response
+
+        delay = _backoff_delay(attempt, response)
+        print(f"HTTP {response.status_code} from {response.url}, retrying in {delay:.1f}s")
+        response.close()
+        time.sleep(delay)
@@ -1,43 +1,84 @@
-import requests
 import os
+from datetime import datetime, timezone
 from dotenv import load_dotenv
+from api_scripts import http_client
+from api_scripts.pagination import paginate, DEFAULT_MAX_PAGES, DEFAULT_MAX_ITEMS
+from cursors import at_or_before
 import json
 
 # Load environment variables
 load_dotenv()
 
-def fetch_mediastack_news(api_key=None, query="", language="en"):
+# MediaStack caps limit at 100 results per request
+PAGE_SIZE = 100
+
+MEDIASTACK_URL = "http://api.mediastack.com/v1/news"
+
+def iter_mediastack_news(api_key=None, query="", language="en", max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=MEDIASTACK_URL):
     """
-    Fetch news articles from MediaStack API.
+    Lazily yield news articles from MediaStack API, one page at a time.
     
     Args:
         api_key (str, optional): MediaStack API key. If None, uses MEDIASTACK_KEY from .env
         query (str): Search keywords
         language (str): Language code for articles (default: 'en')
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to yield
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): News endpoint, as declared in the source registry
         
-    Returns:
-        list: List of article dictionaries
+    Yields:
+        dict: Article dictionaries as each page arrives
     """
     # Use provided API key or get from environment variables
     api_key = api_key or os.getenv("MEDIASTACK_KEY")
     
     if not api_key:
         print("Error: MediaStack API key not found. Please set MEDIASTACK_KEY in .env file")
-        return []
-    
-    url = f"http://api.mediastack.com/v1/news?access_key={api_key}&languages={language}&keywords={query}"
+        return
     
-    try:
-        response = requests.get(url)
+    def fetch_page(page):
+        offset = page * PAGE_SIZE
+        params = {"access_key": api_key, "languages": language, "keywords": query, "limit": PAGE_SIZE, "offset": offset}
+        if since:
+            # date ranges are day granular; finer filtering happens against the cursor
+            params.update({"date": f"{since:%Y-%m-%d},{datetime.now(timezone.utc):%Y-%m-%d}", "sort": "published_desc"})
+        response = http_client.get(url, params=params)
         response.raise_for_status()  # Raise exception for HTTP errors
         
         data = response.json()
         articles = data.get("data", [])  # MediaStack uses 'data' key for results
-        print(f"Fetched {len(articles)} articles from MediaStack.")
-        return articles
+        has_more = offset + len(articles) < data.get("pagination", {}).get("total", 0)
+        return articles, has_more
+    
+    # Results come newest first, so keep paging back to the mark rather than skip a burst
+    yield from paginate(fetch_page, max_pages, max_items, until=at_or_before(since) if since else None)
+
+def fetch_mediastack_news(api_key=None, query="", language="en", max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=MEDIASTACK_URL):
+    """
+    Fetch news articles from MediaStack API.
+    
+    Args:
+        api_key (str, optional): MediaStack API key. If None, uses MEDIASTACK_KEY from .env
+        query (str): Search keywords
+        language (str): Language code for articles (default: 'en')
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to return
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): News endpoint, as declared in the source registry
+        
+    Returns:
+        list: List of article dictionaries
+    """
+    articles = []
+    try:
+        for article in iter_mediastack_news(api_key, query, language, max_pages, max_items, since, url):
+            articles.append(article)
     except Exception as e:
         print(f"Error fetching from MediaStack API: {e}")
-        return []
+    
+    print(f"Fetched {len(articles)} articles from MediaStack.")
+    return articles
 
 if __name__ == "__main__":
     # When run directly, use the API key from .env
@@ -1,43 +1,81 @@
-import requests
 import json
 import os
 from dotenv import load_dotenv
+from api_scripts import http_client
+from api_scripts.pagination import paginate, DEFAULT_MAX_PAGES, DEFAULT_MAX_ITEMS
+from cursors import at_or_before
 
 # Load environment variables
 load_dotenv()
 
-def fetch_newsapi_articles(api_key=None, query="", language='en'):
+# NewsAPI caps pageSize at 100
+PAGE_SIZE = 100
+
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+def iter_newsapi_articles(api_key=None, query="", language='en', max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=NEWSAPI_URL):
     """
-    Fetch news articles from NewsAPI.
+    Lazily yield news articles from NewsAPI, one page at a time.
     
     Args:
         api_key (str, optional): NewsAPI key. If None, uses NEWSAPI_KEY from .env
         query (str): Search query term
         language (str): Language code for articles (default: 'en')
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to yield
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): Everything endpoint, as declared in the source registry
         
-    Returns:
-        list: List of article dictionaries
+    Yields:
+        dict: Article dictionaries as each page arrives
     """
     # Use provided API key or get from environment variables
     api_key = api_key or os.getenv("NEWSAPI_KEY")
     
     if not api_key:
         print("Error: NewsAPI key not found. Please set NEWSAPI_KEY in .env file")
-        return []
-    
-    url = f"https://newsapi.org/v2/everything?q={query}&language={language}&apiKey={api_key}"
+        return
     
-    try:
-        response = requests.get(url)
+    def fetch_page(page):
+        params = {"q": query, "language": language, "apiKey": api_key, "pageSize": PAGE_SIZE, "page": page + 1}
+        if since:
+            params.update({"from": since.strftime("%Y-%m-%dT%H:%M:%S"), "sortBy": "publishedAt"})
+        response = http_client.get(url, params=params)
         response.raise_for_status()  # Raise exception for HTTP errors
         
         data = response.json()
         articles = data.get("articles", [])
-        print(f"Fetched {len(articles)} articles from NewsAPI.")
-        return articles
+        has_more = (page + 1) * PAGE_SIZE < data.get("totalResults", 0)
+        return articles, has_more
+    
+    # Results come newest first, so keep paging back to the mark rather than skip a burst
+    yield from paginate(fetch_page, max_pages, max_items, until=at_or_before(since) if since else None)
+
+def fetch_newsapi_articles(api_key=None, query="", language='en', max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=NEWSAPI_URL):
+    """
+    Fetch news articles from NewsAPI.
+    
+    Args:
+        api_key (str, optional): NewsAPI key. If None, uses NEWSAPI_KEY from .env
+        query (str): Search query term
+        language (str): Language code for articles (default: 'en')
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to return
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): Everything endpoint, as declared in the source registry
+        
+    Returns:
+        list: List of article dictionaries
+    """
+    articles = []
+    try:
+        for article in iter_newsapi_articles(api_key, query, language, max_pages, max_items, since, url):
+            articles.append(article)
     except Exception as e:
         print(f"Error fetching from NewsAPI: {e}")
-        return []
+    
+    print(f"Fetched {len(articles)} articles from NewsAPI.")
+    return articles
 
 if __name__ == "__main__":
     # When run directly, use the API key from .env
@@ -1,15 +1,34 @@
-import requests
+from api_scripts import http_client
+from api_scripts.pagination import paginate, DEFAULT_MAX_PAGES, DEFAULT_MAX_ITEMS
+from cursors import at_or_before
 
-def fetch_nyt_news(api_key, query):
-    url = f"https://api.nytimes.com/svc/search/v2/articlesearch.json?q={query}&api-key={api_key}"
-    response = requests.get(url)
-    if response.status_code == 200:
-        articles = response.json().get("articles", [])
-        print(f"Fetched {len(articles)} articles from New York Times.")
-        return articles
-    else:
-        print(f"Error: {response.status_code} - {response.text}")
-        return []
+# Article Search always returns 10 documents per page
+PAGE_SIZE = 10
+
+NYT_URL = "https://api.nytimes.com/svc/search/v2/articlesearch.json"
+
+def iter_nyt_news(api_key, query, max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=NYT_URL):
+
+    def fetch_page(page):
+        params = {"q": query, "api-key": api_key, "page": page}
+        if since:
+            params.update({"begin_date": since.strftime("%Y%m%d"), "sort": "newest"})
+        response = http_client.get(url, params=params)
+        if response.status_code != 200:
+            print(f"Error: {response.status_code} - {response.text}")
+            return [], False
+        data = response.json().get("response", {})
+        articles = data.get("docs", [])
+        has_more = (page + 1) * PAGE_SIZE < data.get("meta", {}).get("hits", 0)
+        return articles, has_more
+
+    # Results come newest first, so keep paging back to the mark rather than skip a burst
+    yield from paginate(fetch_page, max_pages, max_items, until=at_or_before(since) if since else None)
+
+def fetch_nyt_news(api_key, query, max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=NYT_URL):
+    articles = list(iter_nyt_news(api_key, query, max_pages, max_items, since, url))
+    print(f"Fetched {len(articles)} articles from New York Times.")
+    return articles
 
 if __name__ == "__main__":
     API_KEY = "nytimesarticleapikey"
@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Default page / item budget for paginated fetchers; one page keeps the old quota usage
+DEFAULT_MAX_PAGES = int(os.getenv("FETCH_MAX_PAGES", "1"))
+DEFAULT_MAX_ITEMS = int(os.getenv("FETCH_MAX_ITEMS", "0")) or None
+
+# Page ceiling for newest-first incremental fetches still working back to their high-water mark
+CATCH_UP_MAX_PAGES = int(os.getenv("FETCH_CATCH_UP_PAGES", "5"))
+
+def paginate(fetch_page, max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, prefetch=True, until=None):
+    """
+    Lazily walk a paged API, yielding items as each page arrives.
+
+    While the caller consumes page N, page N+1 is already being requested
+    on a background thread, so downstream work overlaps the network wait.
+    No request is made beyond the page or item budget.
+
+    With ``until``, the walk is a newest-first catch-up to a high-water
+    mark: it stops after the first page holding an item ``until`` accepts,
+    and until then carries on past the page and item budgets, up to
+    CATCH_UP_MAX_PAGES pages, so a burst between polls is not cut short.
+
+    Args:
+        fetch_page (callable): Takes a zero-based page index and returns
+            ``(items, has_more)``
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of items to yield, unbounded if None
+        prefetch (bool): Request the next page while the current one is consumed
+        until (callable, optional): Takes an item and returns True once paging has reached the mark
+
+    Yields:
+        dict: One item at a time, in page order
+    """
+    if max_pages <= 0 or (max_items is not None and max_items <= 0):
+        return
+
+    if until is not None:
+        max_pages, max_items = max(max_pages, CATCH_UP_MAX_PAGES), None
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        pending = executor.submit(fetch_page, 0) if executor else None
+        yielded = 0
+        for page in range(max_pages):
+            items, has_more = pending.result() if executor else fetch_page(page)
+
+            budget_left = max_items is None or yielded + len(items) < max_items
+            # Pages past the mark hold nothing new
+            reached = until is not None and any(until(item) for item in items)
+            more_pages = has_more and items and page + 1 < max_pages and budget_left and not reached
+            if executor and more_pages:
+                pending = executor.submit(fetch_page, page + 1)
+
+            for item in items:
+                yield item
+                yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    return
+
+            if not more_pages:
+                return
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from api_scripts.registry import RATE_LIMITS
+from api_scripts.state_store import load_state, save_state
+
+# Where each provider's used daily quota is kept between runs
+QUOTA_STORE_PATH = os.getenv("PROVIDER_QUOTA_STORE", "./data/provider_quota.json")
+
+# Per-provider request limits are declared with each source in the registry.
+# Any daily quota can be overridden with DAILY_QUOTA_<PROVIDER>, e.g. DAILY_QUOTA_NEWSAPI=1000.
+PROVIDER_LIMITS = RATE_LIMITS
+
+class QuotaExceededError(Exception):
+    """Raised when a provider's daily request quota has been used up."""
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class DailyQuotaStore:
+    """
+    Persistent per-provider count of requests made on the current UTC day.
+
+    Counts reset automatically when the day rolls over and are written
+    through on every request so separate runs share the same allowance.
+    """
+
+    def __init__(self, path=QUOTA_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._usage = load_state(path)
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def used(self, provider):
+        with self._lock:
+            usage = self._usage.get(provider, {})
+            return usage.get("used", 0) if usage.get("date") == self._today() else 0
+
+    def remaining(self, provider, limit):
+        return None if limit is None else max(limit - self.used(provider), 0)
+
+    def consume(self, provider, limit):
+        """Record one request, raising QuotaExceededError if the ceiling is reached."""
+        with self._lock:
+            today = self._today()
+            usage = self._usage.get(provider, {})
+            used = usage.get("used", 0) if usage.get("date") == today else 0
+            if limit is not None and used >= limit:
+                raise QuotaExceededError(f"Daily quota of {limit} requests for {provider} is used up")
+            self._usage[provider] = {"date": today, "used": used + 1}
+            save_state(self.path, self._usage)
+
+def _daily_quota(provider, limits):
+    override = os.getenv(f"DAILY_QUOTA_{provider.upper()}")
+    return int(override) if override else limits.daily_quota
+
+_buckets = {name: TokenBucket(limits.rate, limits.burst) for name, limits in PROVIDER_LIMITS.items()}
+_providers_by_host = {limits.host: name for name, limits in PROVIDER_LIMITS.items()}
+_quota_store = None
+_quota_lock = threading.Lock()
+
+def get_quota_store():
+    """Return the shared quota store, loading it on first use."""
+    global _quota_store
+    if _quota_store is None:
+        with _quota_lock:
+            if _quota_store is None:
+                _quota_store = DailyQuotaStore()
+    return _quota_store
+
+def provider_for_url(url):
+    """Return the rate-limited provider name for a URL, or None if it is unlimited."""
+    return _providers_by_host.get(urlsplit(url).hostname)
+
+def acquire(url):
+    """
+    Wait for permission to send one request to ``url``.
+
+    Charges the provider's daily quota first, so an exhausted provider fails
+    immediately instead of waiting on its bucket, then blocks on the token
+    bucket. URLs that do not belong to a known provider pass straight through.
+    """
+    provider = provider_for_url(url)
+    if provider is None:
+        return
+    get_quota_store().consume(provider, _daily_quota(provider, PROVIDER_LIMITS[provider]))
+    _buckets[provider].acquire()
+
+def remaining_quota():
+    """Return the remaining daily quota for every provider (None for unlimited)."""
+    store = get_quota_store()
+    return {
+        name: store.remaining(name, _daily_quota(name, limits))
+        for name, limits in PROVIDER_LIMITS.items()
+    }
@@ -0,0 +1,176 @@
+import importlib
+import os
+import threading
+from dataclasses import dataclass, field
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Request limits for one provider, matched on its API host."""
+    host: str
+    rate: float                 # sustained requests per second
+    burst: int                  # token bucket capacity
+    daily_quota: int = None     # hard ceiling per UTC day, None for unlimited
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """
+    Declarative description of a news source.
+
+    Nothing here imports the provider's module; ``fetcher`` resolves the
+    fetch function on first call, so disabled or idle sources cost nothing
+    at start-up.
+    """
+    name: str                               # source label used throughout the pipeline
+    module: str                             # module holding the fetch function
+    function: str                           # fetch function name
+    mapper: str                             # name of the raw -> Article function in the articles module
+    endpoint: str = None                    # URL handed to the fetch function as url=; None keeps its default
+    key_env: str = None                     # environment variable holding the API key, if any
+    query_based: bool = True                # takes a search query
+    supports_since: bool = True             # accepts a since= high-water mark
+    newest_first: bool = False              # since= results come newest first, from the mark inclusive
+    rate_limit_name: str = None             # key in RATE_LIMITS
+    rate_limit: RateLimit = None
+    fetch_kwargs: dict = field(default_factory=dict)
+
+    def load(self):
+        """Import the provider module and return its fetch function."""
+        return getattr(importlib.import_module(self.module), self.function)
+
+    def load_mapper(self):
+        """Return this source's raw -> Article mapping function, bound to the source name."""
+        mapper = getattr(importlib.import_module("articles"), self.mapper)
+        return lambda raw: mapper(raw, self.name)
+
+    def fetcher(self):
+        """
+        Build a uniform fetch callable for the fetch engine.
+
+        Query-based sources get ``fetch(query, since)``, the rest ``fetch()``.
+        The declared endpoint is passed on as ``url=``. The provider module
+        is imported the first time the callable runs.
+        """
+        resolved = []
+        lock = threading.Lock()
+
+        def call(*args, **kwargs):
+            if not resolved:
+                with lock:
+                    if not resolved:
+                        resolved.append(self.load())
+            if self.key_env:
+                args = (os.getenv(self.key_env),) + args
+            if self.endpoint:
+                kwargs = {"url": self.endpoint, **kwargs}
+            return resolved[0](*args, **{**self.fetch_kwargs, **kwargs})
+
+        if not self.query_based:
+            return lambda: call()
+        if self.supports_since:
+            return lambda query, since: call(query, since=since)
+        return lambda query, since: call(query)
+
+SOURCES = [
+    SourceSpec(
+        name="NewsAPI",
+        module="api_scripts.newsapi",
+        function="fetch_newsapi_articles",
+        endpoint="https://newsapi.org/v2/everything",
+        mapper="map_newsapi",
+        key_env="NEWSAPI_KEY",
+        newest_first=True,
+        rate_limit_name="newsapi",
+        rate_limit=RateLimit("newsapi.org", rate=1.0, burst=5, daily_quota=100),
+    ),
+    SourceSpec(
+        name="NY Times",
+        module="api_scripts.ny_times",
+        function="fetch_nyt_news",
+        endpoint="https://api.nytimes.com/svc/search/v2/articlesearch.json",
+        mapper="map_nyt",
+        key_env="NYT_KEY",
+        newest_first=True,
+        rate_limit_name="nyt",
+        rate_limit=RateLimit("api.nytimes.com", rate=5 / 60, burst=1, daily_quota=500),
+    ),
+    SourceSpec(
+        name="The Guardian",
+        module="api_scripts.theguardian",
+        function="fetch_guardian_news",
+        endpoint="https://content.guardianapis.com/search",
+        mapper="map_guardian",
+        key_env="GUARDIAN_KEY",
+        newest_first=True,
+        rate_limit_name="guardian",
+        rate_limit=RateLimit("content.guardianapis.com", rate=1.0, burst=1, daily_quota=500),
+    ),
+    SourceSpec(
+        name="MediaStack",
+        module="api_scripts.mediastack",
+        function="fetch_mediastack_news",
+        endpoint="http://api.mediastack.com/v1/news",
+        mapper="map_mediastack",
+        key_env="MEDIASTACK_KEY",
+        newest_first=True,
+        rate_limit_name="mediastack",
+        rate_limit=RateLimit("api.mediastack.com", rate=1.0, burst=2, daily_quota=100),
+    ),
+    SourceSpec(
+        name="GDELT",
+        module="api_scripts.gdelt_project",
+        function="fetch_gdelt_news",
+        endpoint="https://api.gdeltproject.org/api/v2/doc/doc",
+        mapper="map_gdelt",
+        newest_first=True,
+        rate_limit_name="gdelt",
+        rate_limit=RateLimit("api.gdeltproject.org", rate=0.2, burst=1),
+        # Relative window searched when a query has no high-water mark yet
+        fetch_kwargs={"timespan": "24h"},
+    ),
+    SourceSpec(
+        name="Currents",
+        module="api_scripts.currents",
+        function="fetch_currents_news",
+        endpoint="https://api.currentsapi.services/v1/search",
+        mapper="map_currents",
+        key_env="CURRENTS_KEY",
+        newest_first=True,
+        rate_limit_name="currents",
+        rate_limit=RateLimit("api.currentsapi.services", rate=1.0, burst=2, daily_quota=600),
+    ),
+    SourceSpec(
+        name="Google News",
+        module="api_scripts.google_news",
+        function="fetch_google_news_rss",
+        endpoint="https://news.google.com/rss?hl=en-US&gl=US&ceid=US:en",
+        mapper="map_google_news",
+        query_based=False,
+        supports_since=False,
+    ),
+    SourceSpec(
+        name="RSS",
+        module="api_scripts.feed_crawler",
+        function="crawl_feeds",
+        mapper="map_rss",
+        query_based=False,
+        supports_since=False,
+    ),
+]
+
+SOURCES_BY_NAME = {spec.name: spec for spec in SOURCES}
+
+# Provider request limits, derived from the specs above
+RATE_LIMITS = {spec.rate_limit_name: spec.rate_limit for spec in SOURCES if spec.rate_limit}
+
+def enabled_sources():
+    """
+    Return the specs of enabled sources, in registry order.
+
+    ENABLED_SOURCES (comma-separated source names) restricts the set;
+    every registered source is enabled when it is unset.
+    """
+    names = [name.strip() for name in os.getenv("ENABLED_SOURCES", "").split(",") if name.strip()]
+    unknown = [name for name in names if name not in SOURCES_BY_NAME]
+    if unknown:
+        print(f"Ignoring unknown sources in ENABLED_SOURCES: {', '.join(unknown)}")
+    return [spec for spec in SOURCES if not names or spec.name in names]
@@ -1,18 +1,27 @@
-import feedparser
 import json
+from api_scripts.feed_cache import fetch_feed
 
-def fetch_rss_articles(feed_url):
-    feed = feedparser.parse(feed_url)
+def feed_to_articles(feed):
+    """Flatten a parsed feed's entries into plain article dictionaries."""
     articles = []
 
     for entry in feed.entries:
         articles.append({
-            "title": entry.title,
-            "link": entry.link,
-            "summary": entry.summary,
-            "published": entry.published
+            "title": entry.get("title"),
+            "link": entry.get("link"),
+            "summary": entry.get("summary"),
+            "published": entry.get("published")
         })
 
+    return articles
+
+def fetch_rss_articles(feed_url):
+    feed = fetch_feed(feed_url)
+    if feed is None:
+        print(f"RSS feed not modified since last poll: {feed_url}")
+        return []
+
+    articles = feed_to_articles(feed)
     print(f"Fetched {len(articles)} articles from RSS feed.")
     return articles
 
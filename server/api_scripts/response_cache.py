@@ -0,0 +1,107 @@
+import base64
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api_scripts.state_store import save_state
+
+# Cache mode for provider responses:
+#   off    - always hit the network (default)
+#   record - hit the network and store every response
+#   replay - serve only from the cache, never touch the network
+#   ttl    - serve cached responses younger than HTTP_CACHE_TTL seconds, otherwise fetch and store
+CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "off").lower()
+CACHE_DIR = os.getenv("HTTP_CACHE_DIR", "./data/http_cache")
+CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "900"))
+
+MODES = {"off", "record", "replay", "ttl"}
+if CACHE_MODE not in MODES:
+    raise ValueError(f"HTTP_CACHE_MODE must be one of {sorted(MODES)}, got {CACHE_MODE!r}")
+
+# Credentials are left out of cache keys so recordings replay under any API key
+CREDENTIAL_PARAMS = {"apikey", "api-key", "api_key", "access_key"}
+
+# Headers that describe the wire encoding rather than the stored (already decoded) body
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Responses worth keeping; 304s carry no body and 5xx are transient
+CACHEABLE_STATUSES = range(200, 300)
+
+class CacheMissError(Exception):
+    """Raised in replay mode when a request has no recorded response."""
+
+def _normalize_url(url, params=None):
+    """Merge params into the URL, sort the query and drop credential parameters."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query.extend((key, str(value)) for key, value in (params or {}).items() if value is not None)
+    query = sorted((key, value) for key, value in query if key.lower() not in CREDENTIAL_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+def cache_key(url, params=None):
+    """Content address for a GET: a hash of its normalized, credential-free URL."""
+    return hashlib.sha256(_normalize_url(url, params).encode("utf-8")).hexdigest()
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], f"{key}.json")
+
+def lookup(url, params=None, mode=None, cache_dir=None, ttl=None):
+    """
+    Return a cached response for this request if the cache mode allows it.
+
+    Returns None when the caller should go to the network. Raises
+    CacheMissError in replay mode when nothing was recorded.
+    """
+    mode = mode or CACHE_MODE
+    if mode not in ("replay", "ttl"):
+        return None
+
+    path = _entry_path(cache_key(url, params), cache_dir or CACHE_DIR)
+    try:
+        with open(path, "r") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        entry = None
+
+    if entry is None:
+        if mode == "replay":
+            raise CacheMissError(f"No recorded response for {url}")
+        return None
+
+    if mode == "ttl" and time.time() - entry["stored_at"] > (CACHE_TTL if ttl is None else ttl):
+        return None
+
+    return _build_response(entry)
+
+def store(url, params, response, mode=None, cache_dir=None):
+    """Persist a network response when recording or refreshing the TTL cache."""
+    mode = mode or CACHE_MODE
+    if mode not in ("record", "ttl") or response.status_code not in CACHEABLE_STATUSES:
+        return
+
+    entry = {
+        "url": _normalize_url(response.url),
+        "status": response.status_code,
+        "headers": {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+        "encoding": response.encoding,
+        "body": base64.b64encode(response.content).decode("ascii"),
+        "stored_at": time.time(),
+    }
+    save_state(_entry_path(cache_key(url, params), cache_dir or CACHE_DIR), entry)
+
+def _build_response(entry):
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.url = entry["url"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = entry.get("encoding")
+    response.reason = "OK"
+    response._content = base64.b64decode(entry["body"])
+    # Mark the body as already read so iter_content / iter_lines serve it from memory
+    response._content_consumed = True
+    return response
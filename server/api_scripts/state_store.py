@@ -0,0 +1,21 @@
+import json
+import os
+import threading
+
+def load_state(path, default=None):
+    """Load a small JSON state file, returning ``default`` if it is missing or unreadable."""
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {} if default is None else default
+
+def save_state(path, data):
+    """Atomically replace a JSON state file so a crash never leaves it half-written."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as file:
+        json.dump(data, file)
+    os.replace(tmp_path, path)
@@ -1,42 +1,80 @@
-import requests
 import os
 from dotenv import load_dotenv
+from api_scripts import http_client
+from api_scripts.pagination import paginate, DEFAULT_MAX_PAGES, DEFAULT_MAX_ITEMS
+from cursors import at_or_before
 
 # Load environment variables
 load_dotenv()
 
-def fetch_guardian_news(api_key=None, query=""):
+# The Guardian caps page-size at 50
+PAGE_SIZE = 50
+
+GUARDIAN_URL = "https://content.guardianapis.com/search"
+
+def iter_guardian_news(api_key=None, query="", max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=GUARDIAN_URL):
     """
-    Fetch news articles from The Guardian API.
+    Lazily yield news articles from The Guardian API, one page at a time.
     
     Args:
         api_key (str, optional): The Guardian API key. If None, uses GUARDIAN_KEY from .env
         query (str): Search query term
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to yield
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): Search endpoint, as declared in the source registry
         
-    Returns:
-        list: List of article dictionaries
+    Yields:
+        dict: Article dictionaries as each page arrives
     """
     # Use provided API key or get from environment variables
     api_key = api_key or os.getenv("GUARDIAN_KEY")
     
     if not api_key:
         print("Error: Guardian API key not found. Please set GUARDIAN_KEY in .env file")
-        return []
-    
-    url = f"https://content.guardianapis.com/search?q={query}&api-key={api_key}"
+        return
     
-    try:
-        response = requests.get(url)
+    def fetch_page(page):
+        params = {"q": query, "api-key": api_key, "page-size": PAGE_SIZE, "page": page + 1, "show-fields": "trailText"}
+        if since:
+            # from-date is day granular; finer filtering happens against the cursor
+            params.update({"from-date": since.strftime("%Y-%m-%d"), "order-by": "newest"})
+        response = http_client.get(url, params=params)
         response.raise_for_status()  # Raise exception for HTTP errors
         
-        data = response.json()
         # Guardian API response structure is different - extract results correctly
-        articles = data.get("response", {}).get("results", [])
-        print(f"Fetched {len(articles)} articles from The Guardian.")
-        return articles
+        data = response.json().get("response", {})
+        articles = data.get("results", [])
+        has_more = data.get("currentPage", page + 1) < data.get("pages", 0)
+        return articles, has_more
+    
+    # Results come newest first, so keep paging back to the mark rather than skip a burst
+    yield from paginate(fetch_page, max_pages, max_items, until=at_or_before(since) if since else None)
+
+def fetch_guardian_news(api_key=None, query="", max_pages=DEFAULT_MAX_PAGES, max_items=DEFAULT_MAX_ITEMS, since=None, url=GUARDIAN_URL):
+    """
+    Fetch news articles from The Guardian API.
+    
+    Args:
+        api_key (str, optional): The Guardian API key. If None, uses GUARDIAN_KEY from .env
+        query (str): Search query term
+        max_pages (int): Maximum number of pages to request
+        max_items (int, optional): Maximum number of articles to return
+        since (datetime, optional): Only request articles published after this UTC time
+        url (str): Search endpoint, as declared in the source registry
+        
+    Returns:
+        list: List of article dictionaries
+    """
+    articles = []
+    try:
+        for article in iter_guardian_news(api_key, query, max_pages, max_items, since, url):
+            articles.append(article)
     except Exception as e:
         print(f"Error fetching from The Guardian API: {e}")
-        return []
+    
+    print(f"Fetched {len(articles)} articles from The Guardian.")
+    return articles
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+import os
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+
+from cursors import parse_published
+
+# Root of the date-partitioned Parquet archive of analyzed articles; empty disables archiving
+ARCHIVE_DIR = os.getenv("ARTICLE_ARCHIVE_DIR", "./data/archive")
+
+# Rows buffered before a batch is written, bounding memory for large runs
+ARCHIVE_BATCH_ROWS = 50_000
+
+# Low-cardinality columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = ("source", "provider", "political_bias", "sentiment")
+
+def _pyarrow():
+    """Import pyarrow on first use; it is only needed when the archive is enabled."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+    except ImportError as e:
+        raise RuntimeError("The article archive needs the pyarrow package") from e
+    return pyarrow
+
+def _schema(pa):
+    categorical = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("source", categorical),
+        ("provider", categorical),
+        ("political_bias", categorical),
+        ("sentiment", categorical),
+        ("sentiment_score", pa.float64()),
+        ("published", pa.timestamp("s", tz="UTC")),
+        ("url", pa.string()),
+        ("title", pa.string()),
+        ("story_id", pa.string()),
+        ("date", pa.string()),
+    ])
+
+def _write_batch(rows, archive_dir, run_id, batch):
+    pa = _pyarrow()
+    schema = _schema(pa)
+    columns = {name: [row[name] for row in rows] for name in schema.names}
+    table = pa.table({
+        name: (pa.array(values, pa.string()).dictionary_encode() if name in CATEGORICAL_COLUMNS
+               else pa.array(values, schema.field(name).type))
+        for name, values in columns.items()
+    }).cast(schema)
+    pa.dataset.write_dataset(
+        table,
+        archive_dir,
+        format="parquet",
+        partitioning=pa.dataset.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+        # One file per run and batch, so appends never overwrite earlier runs
+        basename_template=f"part-{run_id}-{batch}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+def _row(article, today):
+    published = parse_published(article.get("published"))
+    return {
+        "source": article.get("source"),
+        "provider": article.get("provider"),
+        "political_bias": article.get("political_bias"),
+        "sentiment": article.get("sentiment"),
+        "sentiment_score": article.get("sentiment_score"),
+        "published": published,
+        "url": article.get("url"),
+        "title": article.get("title"),
+        "story_id": article.get("story_id"),
+        "date": published.strftime("%Y-%m-%d") if published else today,
+    }
+
+def archive_stream(articles, archive_dir=ARCHIVE_DIR):
+    """
+    Pass analyzed articles through unchanged while appending them to the archive.
+
+    Rows are written in batches to ``<archive_dir>/date=YYYY-MM-DD/``,
+    partitioned by publication day (the run's day when unknown). Each
+    run writes its own files, so the dataset only ever grows. If pyarrow
+    is missing the articles still pass through, unarchived.
+
+    Args:
+        articles (iterable): Analyzed article dicts, e.g. from analyze_stream
+        archive_dir (str): Dataset root; an empty value disables archiving
+
+    Yields:
+        dict: Each input article
+    """
+    if not archive_dir:
+        yield from articles
+        return
+
+    run_id = uuid.uuid4().hex
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    rows = []
+    written = {"batches": 0, "articles": 0}
+
+    def flush():
+        try:
+            _write_batch(rows, archive_dir, run_id, written["batches"])
+            written["articles"] += len(rows)
+        except Exception as e:
+            print(f"Error archiving articles: {e}")
+        written["batches"] += 1
+        rows.clear()
+
+    try:
+        for article in articles:
+            rows.append(_row(article, today))
+            yield article
+            if len(rows) >= ARCHIVE_BATCH_ROWS:
+                flush()
+    finally:
+        if rows:
+            flush()
+        if written["articles"]:
+            print(f"Archived {written['articles']} articles to {archive_dir}.")
+
+def append_to_archive(articles, archive_dir=ARCHIVE_DIR):
+    """Append analyzed articles to the archive without passing them on."""
+    deque(archive_stream(articles, archive_dir), maxlen=0)
+
+def load_archive(archive_dir=ARCHIVE_DIR, start=None, end=None, columns=None):
+    """
+    Read archived articles as an Arrow table.
+
+    Args:
+        archive_dir (str): Dataset root
+        start (str, optional): First day to include, "YYYY-MM-DD"
+        end (str, optional): Last day to include, "YYYY-MM-DD"
+        columns (list, optional): Columns to read, all if None
+
+    Returns:
+        pyarrow.Table: The matching rows; only partitions in range are scanned
+    """
+    pa = _pyarrow()
+    dataset = pa.dataset.dataset(archive_dir, format="parquet", partitioning="hive")
+    day = pa.dataset.field("date")
+    condition = None
+    if start:
+        condition = day >= start
+    if end:
+        condition = day <= end if condition is None else condition & (day <= end)
+    return dataset.to_table(columns=columns, filter=condition)
+
+def bias_share_by_source_day(archive_dir=ARCHIVE_DIR, start=None, end=None):
+    """
+    Share of each political bias label among every source's articles, per day.
+
+    Computed with Arrow group-bys over the date, source and
+    political_bias columns only, so no per-article Python runs.
+
+    Returns:
+        pyarrow.Table: Columns date, source, political_bias, articles and share, sorted
+    """
+    pa = _pyarrow()
+    pc = pa.compute
+    table = load_archive(archive_dir, start, end, columns=["date", "source", "political_bias"])
+    # Group keys are compared as plain strings so batches with different dictionaries line up
+    table = table.cast(pa.schema([(name, pa.string()) for name in table.column_names]))
+    counts = table.group_by(["date", "source", "political_bias"]).aggregate([([], "count_all")])
+    counts = counts.rename_columns({"count_all": "articles"})
+    totals = counts.group_by(["date", "source"]).aggregate([("articles", "sum")])
+    joined = counts.join(totals, keys=["date", "source"])
+    share = pc.divide(pc.cast(joined["articles"], pa.float64()), pc.cast(joined["articles_sum"], pa.float64()))
+    result = joined.drop_columns(["articles_sum"]).append_column("share", share)
+    return result.sort_by([("date", "ascending"), ("source", "ascending"), ("political_bias", "ascending")])
+
+if __name__ == "__main__":
+    import sys
+    start, end = (sys.argv[1:3] + [None, None])[:2]
+    for row in bias_share_by_source_day(start=start, end=end).to_pylist():
+        print(f"{row['date']}  {row['source'] or '-':<30} {row['political_bias']:<7} {row['articles']:>6} {row['share']:.1%}")
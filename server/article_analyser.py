@@ -1,56 +1,18 @@
-import json
-import nltk
-from nltk.sentiment.vader import SentimentIntensityAnalyzer
-import requests
-from typing import Dict, List, Any
-import spacy
+from typing import Dict, List, Any, Iterable, Iterator
 import os
 from dotenv import load_dotenv
 
+from analysis_cache import AnalysisCache, cache_key, lexicon_version
+from batch_sentiment import BatchVader
+from bias_lexicon import left_leaning_keywords, right_leaning_keywords, bias_keyword_automaton
+from jsonl import read_jsonl, write_jsonl
+from nlp_models import SPACY_BATCH_SIZE, SPACY_N_PROCESS, LazyResource, get_nlp, get_sia
+
 # Load environment variables
 load_dotenv()
 
-# Download required NLTK resources if not already downloaded
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
-
-try:
-    nltk.data.find('punkt')
-except LookupError:
-    nltk.download('punkt')
-
-# Initialize the sentiment analyzer
-sia = SentimentIntensityAnalyzer()
-
-# Load spaCy language model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    # If model not installed, download it
-    print("Downloading spaCy language model...")
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
-
-# Political bias dictionaries - more comprehensive for better classification
-left_leaning_keywords = [
-    "progressive", "liberal", "democrat", "socialism", "social justice", 
-    "equality", "diversity", "inclusion", "climate change", "renewable energy",
-    "gun control", "abortion rights", "pro-choice", "LGBTQ+ rights", "universal healthcare",
-    "tax the rich", "wealth tax", "welfare", "regulation", "union", "labor rights",
-    "immigration reform", "racial justice", "defund police", "income inequality",
-    "green new deal", "student loan forgiveness", "living wage"
-]
-
-right_leaning_keywords = [
-    "conservative", "republican", "free market", "capitalism", "traditional values",
-    "tax cuts", "deregulation", "second amendment", "pro-life", "religious freedom",
-    "border security", "national security", "military spending", "law and order",
-    "small government", "family values", "patriotism", "american exceptionalism",
-    "tough on crime", "deficit reduction", "individual liberty", "personal responsibility",
-    "school choice", "free speech", "constitutional originalism"
-]
+# NLTK data, the VADER analyzer and the spaCy model are loaded on first use
+# (or up front with nlp_models.warm_up()), so importing this module stays cheap
 
 # News source bias reference
 news_source_bias = {
@@ -89,12 +51,34 @@ news_source_bias = {
     "NPR": "Center"
 }
 
-def extract_keywords(text: str) -> List[str]:
-    """Extract keywords from text using spaCy."""
-    if not text:
-        return []
-    
-    doc = nlp(text)
+# Case-insensitive view of the reference, since providers spell outlet names inconsistently
+_news_source_bias_casefold = {name.casefold(): bias for name, bias in news_source_bias.items()}
+
+# Bump when sentiment or bias scoring logic changes, to invalidate cached results
+ANALYZER_VERSION = "1"
+
+# Fingerprint of the keyword lexicons and source reference; edits invalidate cached results
+LEXICON_VERSION = lexicon_version(left_leaning_keywords, right_leaning_keywords, news_source_bias)
+
+# Articles whose sentiment is scored together in one vectorized VADER pass
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "256"))
+
+_analysis_cache = LazyResource(AnalysisCache)
+_batch_vader = LazyResource(lambda: BatchVader(get_sia()))
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the shared sentiment/bias result cache, opening its on-disk tier on first use."""
+    return _analysis_cache.get()
+
+def _analyzer_version() -> str:
+    # The VADER lexicon ships with nltk, so its version is part of the analyzer's
+    try:
+        from importlib.metadata import version
+        return f"{ANALYZER_VERSION}+nltk{version('nltk')}"
+    except Exception:
+        return ANALYZER_VERSION
+
+def _doc_keywords(doc) -> List[str]:
     keywords = []
     
     # Get nouns and proper nouns
@@ -108,6 +92,26 @@ def extract_keywords(text: str) -> List[str]:
     
     return list(set(keywords))
 
+def extract_keywords(text: str) -> List[str]:
+    """Extract keywords from text using spaCy."""
+    if not text:
+        return []
+    
+    return _doc_keywords(get_nlp()(text))
+
+def extract_keywords_batch(texts: Iterable[str], batch_size: int = SPACY_BATCH_SIZE,
+                           n_process: int = SPACY_N_PROCESS) -> Iterator[List[str]]:
+    """
+    Extract keywords from many texts, yielding one list per text in order.
+
+    Texts go through nlp.pipe in batches of ``batch_size``, optionally
+    spread over ``n_process`` worker processes, which is far cheaper
+    than one nlp() call per text for bulk runs.
+    """
+    texts = (text or "" for text in texts)
+    for doc in get_nlp().pipe(texts, batch_size=batch_size, n_process=n_process):
+        yield _doc_keywords(doc)
+
 def calculate_bias_score(text: str) -> float:
     """
     Calculate political bias score from -1 (left) to 1 (right).
@@ -116,11 +120,10 @@ def calculate_bias_score(text: str) -> float:
     if not text:
         return 0.0
     
-    text = text.lower()
-    
-    # Count occurrences of bias keywords
-    left_count = sum(1 for keyword in left_leaning_keywords if keyword.lower() in text)
-    right_count = sum(1 for keyword in right_leaning_keywords if keyword.lower() in text)
+    # Count distinct bias keywords, matched on word boundaries in one pass
+    counts = bias_keyword_automaton.count(text)
+    left_count = counts["left"]
+    right_count = counts["right"]
     
     # Calculate bias score between -1 and 1
     total_count = left_count + right_count
@@ -129,16 +132,20 @@ def calculate_bias_score(text: str) -> float:
     
     return (right_count - left_count) / total_count
 
-def determine_political_bias(article: Dict[str, Any]) -> str:
+def determine_political_bias(article: Dict[str, Any], content_bias_score: float = None) -> str:
     """
     Determine the political bias of an article.
     Returns "Left", "Right", or "Center"
+
+    content_bias_score may be passed in when it has already been computed
+    for a near-duplicate of this article; the source weighting is always
+    applied per article.
     """
     # Check if we already know the source's bias
-    source = article.get("source", "").strip()
-    if source in news_source_bias:
+    source = (article.get("source") or "").strip()
+    source_bias = news_source_bias.get(source) or _news_source_bias_casefold.get(source.casefold())
+    if source_bias:
         # Source has known bias, weight this heavily
-        source_bias = news_source_bias[source]
         source_bias_score = 1.0 if source_bias == "Right" else (-1.0 if source_bias == "Left" else 0.0)
         weight_source = 0.6  # Source has 60% weight
     else:
@@ -146,11 +153,10 @@ def determine_political_bias(article: Dict[str, Any]) -> str:
         weight_source = 0.0
     
     # Analyze content bias
-    title = article.get("title", "")
-    description = article.get("description", "")
-    content_text = f"{title} {description}".lower()
-    
-    content_bias_score = calculate_bias_score(content_text)
+    if content_bias_score is None:
+        title = article.get("title") or ""
+        description = article.get("description") or ""
+        content_bias_score = calculate_bias_score(f"{title} {description}".lower())
     weight_content = 1.0 - weight_source  # Content has remaining weight
     
     # Weighted average of source and content bias
@@ -172,9 +178,10 @@ def analyze_sentiment(text: str) -> Dict[str, Any]:
     if not text:
         return {"score": 0.0, "label": "Neutral"}
     
-    sentiment = sia.polarity_scores(text)
-    compound_score = sentiment['compound']
-    
+    sentiment = get_sia().polarity_scores(text)
+    return _sentiment_result(sentiment['compound'])
+
+def _sentiment_result(compound_score: float) -> Dict[str, Any]:
     if compound_score >= 0.05:
         label = "Positive"
     elif compound_score <= -0.05:
@@ -187,68 +194,156 @@ def analyze_sentiment(text: str) -> Dict[str, Any]:
         "label": label
     }
 
-def analyze_articles_with_bias(input_file: str, output_file: str) -> None:
+def analyze_sentiment_batch(texts: List[str]) -> List[Dict[str, Any]]:
     """
-    Analyze political bias and sentiment of articles.
+    Analyze sentiment of many texts at once.
+
+    Same scores and labels as analyze_sentiment, computed in one NumPy
+    pass over the whole batch by BatchVader.
     """
-    print(f"Analyzing articles from {input_file}...")
-    
+    if not texts:
+        return []
+    scores = _batch_vader.get().compound_scores([text or "" for text in texts])
+    return [_sentiment_result(float(score)) for score in scores]
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _score_stories(pending: List[str]) -> List[Dict[str, Any]]:
+    # Batch scoring failures fall back to one text at a time, so a bad batch costs speed, not articles
     try:
-        with open(input_file, 'r') as f:
-            articles = json.load(f)
+        return analyze_sentiment_batch(pending)
     except Exception as e:
-        print(f"Error loading articles: {e}")
-        return
-    
-    analyzed_articles = []
+        print(f"Error scoring sentiment batch, scoring articles one by one: {e}")
+        return [analyze_sentiment(text) for text in pending]
+
+def analyze_stream(articles: Iterable[Any], batch_size: int = SENTIMENT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Analyze political bias and sentiment of articles as they arrive.
+
+    Accepts article dicts or normalized Article objects and yields the
+    analyzed article dicts, so stages can be chained in memory without
+    touching disk. Articles are read ``batch_size`` at a time and the
+    uncached texts of each batch get their sentiment scored together.
+    The bias distribution is printed once the input is exhausted.
+    """
+    # Content analysis per story cluster, reused for every near-duplicate copy
+    story_analysis = {}
+    bias_counts = {"Left": 0, "Center": 0, "Right": 0}
+    analyzed_count = 0
+    # Results of earlier runs, keyed by text, source and scoring versions
+    cache = get_analysis_cache()
+    analyzer_version = _analyzer_version()
+    hits_before = cache.hits
     
-    for article in articles:
-        try:
-            # Get text to analyze
-            title = article.get("title", "")
-            description = article.get("description", "")
-            analysis_text = f"{title} {description}"
-            
-            # Skip if no text to analyze
-            if not analysis_text.strip():
-                continue
+    for chunk in _chunks(articles, batch_size):
+        prepared = []
+        # Texts still to score in this batch, one per story cluster (or per unclustered article)
+        pending = []
+        pending_stories = {}
+        for article in chunk:
+            if not isinstance(article, dict):
+                article = article.to_dict()
+            try:
+                # Get text to analyze
+                title = article.get("title") or ""
+                description = article.get("description") or ""
+                analysis_text = f"{title} {description}"
+                
+                # Skip if no text to analyze
+                if not analysis_text.strip():
+                    continue
+                    
+                key = cache_key(analysis_text, article.get("source"), LEXICON_VERSION, analyzer_version)
+                cached = cache.get(key)
+                slot = None
+                if cached is None:
+                    story_id = article.get("story_id")
+                    if story_id is None or story_id not in story_analysis:
+                        if story_id is None or story_id not in pending_stories:
+                            pending.append(analysis_text)
+                            if story_id is not None:
+                                pending_stories[story_id] = len(pending) - 1
+                        slot = len(pending) - 1 if story_id is None else pending_stories[story_id]
+                prepared.append((article, analysis_text, key, cached, slot))
+            except Exception as e:
+                print(f"Error analyzing article: {e}")
+        
+        sentiments = _score_stories(pending)
+        
+        for article, analysis_text, key, cached, slot in prepared:
+            try:
+                if cached is not None:
+                    sentiment_analysis = {"label": cached["sentiment"], "score": cached["sentiment_score"]}
+                    political_bias = cached["political_bias"]
+                else:
+                    story_id = article.get("story_id")
+                    if story_id in story_analysis:
+                        sentiment_analysis, content_bias_score = story_analysis[story_id]
+                        scored_text = None
+                    else:
+                        # Analyze content bias; sentiment was scored with the batch
+                        sentiment_analysis = sentiments[slot]
+                        scored_text = pending[slot]
+                        content_bias_score = calculate_bias_score(scored_text.lower())
+                        if story_id is not None:
+                            story_analysis[story_id] = (sentiment_analysis, content_bias_score)
+                    
+                    # Determine political bias
+                    political_bias = determine_political_bias(article, content_bias_score)
+                    # Near-duplicates reuse their cluster's result in memory only; the cache
+                    # maps each text to the result scored from that text
+                    if scored_text == analysis_text:
+                        cache.put(key, {
+                            "sentiment": sentiment_analysis["label"],
+                            "sentiment_score": sentiment_analysis["score"],
+                            "political_bias": political_bias,
+                        })
                 
-            # Analyze sentiment
-            sentiment_analysis = analyze_sentiment(analysis_text)
+            except Exception as e:
+                print(f"Error analyzing article: {e}")
+                continue
             
-            # Determine political bias
-            political_bias = determine_political_bias(article)
+            analyzed_count += 1
+            if political_bias in bias_counts:
+                bias_counts[political_bias] += 1
             
             # Create analyzed article
-            analyzed_article = {
+            yield {
                 **article,
                 "sentiment": sentiment_analysis["label"],
                 "sentiment_score": sentiment_analysis["score"],
                 "political_bias": political_bias
             }
-            
-            analyzed_articles.append(analyzed_article)
-            
-        except Exception as e:
-            print(f"Error analyzing article: {e}")
-            continue
     
-    print(f"Analyzed {len(analyzed_articles)} articles")
+    cache.flush()
+    print(f"Analyzed {analyzed_count} articles ({len(story_analysis)} distinct stories, "
+          f"{cache.hits - hits_before} cached results reused)")
     print(f"Political bias distribution:")
-    bias_counts = {"Left": 0, "Center": 0, "Right": 0}
-    for article in analyzed_articles:
-        bias = article.get("political_bias", "Unknown")
-        if bias in bias_counts:
-            bias_counts[bias] += 1
-    
     for bias, count in bias_counts.items():
-        percentage = (count / len(analyzed_articles)) * 100 if analyzed_articles else 0
+        percentage = (count / analyzed_count) * 100 if analyzed_count else 0
         print(f"  {bias}: {count} ({percentage:.1f}%)")
+
+def analyze_articles_with_bias(input_file: str, output_file: str) -> None:
+    """
+    Analyze political bias and sentiment of articles.
+
+    File-based wrapper around analyze_stream, kept for debugging. Both
+    files are JSON Lines (optionally .gz or .zst) and are streamed one
+    article at a time.
+    """
+    print(f"Analyzing articles from {input_file}...")
     
-    # Save analyzed articles
     try:
-        with open(output_file, 'w') as f:
-            json.dump(analyzed_articles, f, indent=4)
-        print(f"Saved analyzed articles to {output_file}")
+        write_jsonl(output_file, analyze_stream(read_jsonl(input_file)))
     except Exception as e:
-        print(f"Error saving analyzed articles: {e}")
+        print(f"Error analyzing articles: {e}")
+        return
+    print(f"Saved analyzed articles to {output_file}")
@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+def _configure_sqlite(sender, connection, **kwargs):
+    """Put every SQLite connection in WAL mode so readers never block the pipeline's writes."""
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode=WAL;")
+            cursor.execute("PRAGMA synchronous=NORMAL;")
+
+
+class ArticleStoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "article_store"
+
+    def ready(self):
+        connection_created.connect(_configure_sqlite)
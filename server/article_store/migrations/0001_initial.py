@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoredArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=2048, unique=True)),
+                ('source', models.CharField(db_index=True, max_length=200)),
+                ('provider', models.CharField(max_length=100)),
+                ('providers', models.JSONField(default=list)),
+                ('title', models.TextField(blank=True, default='')),
+                ('description', models.TextField(blank=True, default='')),
+                ('published', models.DateTimeField(db_index=True, null=True)),
+                ('story_id', models.CharField(db_index=True, max_length=64, null=True)),
+                ('sentiment', models.CharField(max_length=10, null=True)),
+                ('sentiment_score', models.FloatField(null=True)),
+                ('political_bias', models.CharField(db_index=True, max_length=10, null=True)),
+                ('content_hash', models.CharField(db_index=True, max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['source', 'published'], name='article_sto_source_16eb9c_idx')],
+            },
+        ),
+    ]
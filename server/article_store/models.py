@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class StoredArticle(models.Model):
+    """An analyzed article, keyed by its canonical URL."""
+
+    url = models.URLField(max_length=2048, unique=True)
+    source = models.CharField(max_length=200, db_index=True)
+    provider = models.CharField(max_length=100)
+    providers = models.JSONField(default=list)
+    title = models.TextField(blank=True, default="")
+    description = models.TextField(blank=True, default="")
+    published = models.DateTimeField(null=True, db_index=True)
+    story_id = models.CharField(max_length=64, null=True, db_index=True)
+    sentiment = models.CharField(max_length=10, null=True)
+    sentiment_score = models.FloatField(null=True)
+    political_bias = models.CharField(max_length=10, null=True, db_index=True)
+    # SHA-256 of the normalized title and description, to tell whether a stored article changed
+    content_hash = models.CharField(max_length=64, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["source", "published"]),
+        ]
+
+    def __str__(self):
+        return self.title or self.url
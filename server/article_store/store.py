@@ -0,0 +1,123 @@
+import hashlib
+import os
+import re
+
+import django
+from django.apps import apps
+
+# Rows per INSERT ... ON CONFLICT statement; keeps well under SQLite's bound-parameter limit
+UPSERT_BATCH_SIZE = 500
+
+# Columns refreshed when an article that is already stored comes in again
+_UPDATE_FIELDS = [
+    "source", "provider", "providers", "title", "description", "published", "story_id",
+    "sentiment", "sentiment_score", "political_bias", "content_hash", "updated_at",
+]
+
+_WHITESPACE = re.compile(r"\s+")
+
+def _setup():
+    """Configure Django on first use when running outside manage.py (e.g. from main.py)."""
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+        django.setup()
+    from article_store.models import StoredArticle
+    return StoredArticle
+
+def content_hash(article):
+    """SHA-256 of an article's whitespace- and case-normalized title and description."""
+    text = f"{article.get('title') or ''}\n{article.get('description') or ''}"
+    return hashlib.sha256(_WHITESPACE.sub(" ", text).strip().lower().encode("utf-8")).hexdigest()
+
+def _model_fields(article):
+    from cursors import parse_published
+    return {
+        "url": article["url"],
+        "source": article.get("source") or "",
+        "provider": article.get("provider") or "",
+        "providers": article.get("providers") or [],
+        "title": article.get("title") or "",
+        "description": article.get("description") or "",
+        "published": parse_published(article.get("published")),
+        "story_id": article.get("story_id"),
+        "sentiment": article.get("sentiment"),
+        "sentiment_score": article.get("sentiment_score"),
+        "political_bias": article.get("political_bias"),
+        "content_hash": content_hash(article),
+    }
+
+def upsert_articles(articles):
+    """
+    Insert or update analyzed articles by canonical URL in bulk.
+
+    Args:
+        articles (list): Analyzed article dicts; ones without a URL are skipped
+
+    Returns:
+        int: Number of rows written
+    """
+    StoredArticle = _setup()
+    rows = [StoredArticle(**_model_fields(article)) for article in articles if article.get("url")]
+    StoredArticle.objects.bulk_create(
+        rows,
+        batch_size=UPSERT_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["url"],
+        update_fields=_UPDATE_FIELDS,
+    )
+    return len(rows)
+
+def store_stream(articles, batch_size=UPSERT_BATCH_SIZE):
+    """
+    Pass analyzed articles through unchanged while upserting them into the store in batches.
+
+    A failed batch is reported and skipped so the rest of the pipeline carries on.
+    """
+    batch = []
+    stored = 0
+
+    def flush():
+        nonlocal stored
+        try:
+            stored += upsert_articles(batch)
+        except Exception as e:
+            print(f"Error storing articles: {e}")
+        batch.clear()
+
+    try:
+        for article in articles:
+            batch.append(article)
+            yield article
+            if len(batch) >= batch_size:
+                flush()
+    finally:
+        if batch:
+            flush()
+        if stored:
+            print(f"Stored {stored} articles in the local article store.")
+
+def stored_content_hashes(urls):
+    """Return ``{url: content_hash}`` for the given canonical URLs that are already stored."""
+    StoredArticle = _setup()
+    urls = list(urls)
+    hashes = {}
+    for start in range(0, len(urls), UPSERT_BATCH_SIZE):
+        chunk = urls[start:start + UPSERT_BATCH_SIZE]
+        hashes.update(StoredArticle.objects.filter(url__in=chunk).values_list("url", "content_hash"))
+    return hashes
+
+def recent_articles(source=None, political_bias=None, since=None, limit=100):
+    """
+    Newest stored articles, optionally filtered by source, bias label and publication time.
+
+    Each filter maps onto one of the table's indexes.
+    """
+    StoredArticle = _setup()
+    query = StoredArticle.objects.all()
+    if source:
+        query = query.filter(source=source)
+    if political_bias:
+        query = query.filter(political_bias=political_bias)
+    if since:
+        query = query.filter(published__gte=since)
+    return list(query.order_by("-published")[:limit])
@@ -0,0 +1,119 @@
+import sys
+from dataclasses import dataclass
+
+from cursors import parse_published
+
+@dataclass(slots=True)
+class Article:
+    """
+    One normalized article.
+
+    Slotted to keep million-article batches small: no per-instance
+    ``__dict__``, and the few distinct source/provider strings are
+    interned so every article shares the same string objects.
+    """
+    source: str         # outlet that published the story, e.g. "CNN"
+    provider: str       # API or feed it came through, e.g. "NewsAPI"
+    title: str
+    description: str
+    url: str
+    published: str      # ISO 8601 UTC when parseable, otherwise the raw provider value
+    providers: tuple = ()   # every provider that carried the story, once deduplicated
+    story_id: str = None    # near-duplicate cluster, shared by syndicated copies of one story
+
+    def to_dict(self):
+        return {
+            "source": self.source,
+            "provider": self.provider,
+            "title": self.title,
+            "description": self.description,
+            "url": self.url,
+            "published": self.published,
+            "providers": list(self.providers or (self.provider,)),
+            "story_id": self.story_id,
+        }
+
+# Outlet names for GDELT domains, spelled as in the news source bias reference
+DOMAIN_OUTLETS = {
+    "cnn.com": "CNN", "edition.cnn.com": "CNN", "msnbc.com": "MSNBC", "nbcnews.com": "NBC News",
+    "nytimes.com": "New York Times", "washingtonpost.com": "Washington Post",
+    "huffpost.com": "Huffington Post", "theguardian.com": "The Guardian", "vox.com": "Vox",
+    "buzzfeed.com": "BuzzFeed", "slate.com": "Slate", "foxnews.com": "Fox News",
+    "breitbart.com": "Breitbart", "dailywire.com": "The Daily Wire", "theblaze.com": "The Blaze",
+    "nationalreview.com": "National Review", "washingtontimes.com": "Washington Times",
+    "newsmax.com": "NewsMax", "spectator.co.uk": "The Spectator", "nypost.com": "New York Post",
+    "washingtonexaminer.com": "Washington Examiner", "reuters.com": "Reuters", "apnews.com": "AP",
+    "bbc.com": "BBC", "bbc.co.uk": "BBC", "thehill.com": "The Hill", "usatoday.com": "USA Today",
+    "bloomberg.com": "Bloomberg", "wsj.com": "The Wall Street Journal", "economist.com": "The Economist",
+    "cnbc.com": "CNBC", "axios.com": "Axios", "ft.com": "Financial Times", "npr.org": "NPR",
+}
+
+def _field(raw, *paths):
+    """Return the first non-empty value among dotted field paths such as "headline.main"."""
+    for path in paths:
+        value = raw
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value:
+            return value
+    return None
+
+def _published(value):
+    parsed = parse_published(value)
+    return parsed.strftime("%Y-%m-%dT%H:%M:%SZ") if parsed else value
+
+def _article(source, provider, title, description, url, published):
+    return Article(
+        source=sys.intern(source or provider),
+        provider=sys.intern(provider),
+        title=title,
+        description=description,
+        url=url,
+        published=_published(published),
+    )
+
+def map_newsapi(raw, provider="NewsAPI"):
+    return _article(_field(raw, "source.name"), provider, raw.get("title"), raw.get("description"),
+                    raw.get("url"), raw.get("publishedAt"))
+
+def map_nyt(raw, provider="NY Times"):
+    return _article("New York Times", provider, _field(raw, "headline.main"), _field(raw, "abstract", "snippet"),
+                    raw.get("web_url"), raw.get("pub_date"))
+
+def map_guardian(raw, provider="The Guardian"):
+    return _article("The Guardian", provider, raw.get("webTitle"), _field(raw, "fields.trailText"),
+                    raw.get("webUrl"), raw.get("webPublicationDate"))
+
+def map_mediastack(raw, provider="MediaStack"):
+    return _article(raw.get("source"), provider, raw.get("title"), raw.get("description"),
+                    raw.get("url"), raw.get("published_at"))
+
+def map_gdelt(raw, provider="GDELT"):
+    domain = (raw.get("domain") or "").lower()
+    domain = domain[4:] if domain.startswith("www.") else domain
+    return _article(DOMAIN_OUTLETS.get(domain, domain), provider, raw.get("title"), None,
+                    raw.get("url"), raw.get("seendate"))
+
+def map_currents(raw, provider="Currents"):
+    return _article(None, provider, raw.get("title"), raw.get("description"),
+                    raw.get("url"), raw.get("published"))
+
+def map_google_news(raw, provider="Google News"):
+    # Google News titles carry the outlet as a " - Outlet" suffix
+    title = raw.get("title") or ""
+    outlet = raw.get("source")
+    if outlet and title.endswith(f" - {outlet}"):
+        title = title[:-len(outlet) - 3]
+    elif not outlet and " - " in title:
+        title, _, outlet = title.rpartition(" - ")
+    return _article(outlet, provider, title or None, raw.get("summary"),
+                    raw.get("link"), raw.get("published"))
+
+def map_rss(raw, provider="RSS"):
+    return _article(raw.get("feed"), provider, raw.get("title"), raw.get("summary"),
+                    raw.get("link"), raw.get("published"))
+
+def map_generic(raw, provider):
+    """Best-effort mapping for sources without a dedicated mapper."""
+    return _article(None, provider, _field(raw, "title", "headline.main"), _field(raw, "description", "summary"),
+                    _field(raw, "url", "link"), _field(raw, "publishedAt", "published", "seendate"))
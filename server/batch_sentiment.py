@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+# Words that change the valence of their neighbours in VADER; in texts containing any of
+# them (or a negated contraction, or an idiom) lexicon words are scored with context
+CONTEXT_WORDS = {"but", "least", "kind", "sort", "just", "never", "so", "this"}
+
+class BatchVader:
+    """
+    Batch VADER compound scoring with NumPy.
+
+    Every text is tokenized exactly as VADER does and its tokens are mapped
+    to lexicon valences through one array index; the ALL-CAPS emphasis,
+    per-text valence sums, punctuation emphasis and normalization then run
+    as array operations over the whole batch. In the minority of texts
+    whose scores depend on word context (negations, boosters and
+    dampeners, "but", "least", "this" and "so", idioms), only the lexicon
+    words are re-scored with the wrapped analyzer's own valence rules
+    before the same array pass, so results match polarity_scores.
+    """
+
+    def __init__(self, sia):
+        """
+        Args:
+            sia (SentimentIntensityAnalyzer): The NLTK VADER analyzer whose lexicon and rules to follow
+        """
+        self.sia = sia
+        constants = sia.constants
+        self._constants = constants
+        words = list(sia.lexicon)
+        # Index 0 is "not in the lexicon"
+        self._index = {word: position for position, word in enumerate(words, 1)}
+        self._valences = np.array([0.0] + [sia.lexicon[word] for word in words])
+        self._context_words = (
+            frozenset(word.lower() for word in constants.NEGATE)
+            | frozenset(word for word in constants.BOOSTER_DICT if " " not in word)
+            | frozenset(CONTEXT_WORDS)
+        )
+        self._idioms = list(constants.SPECIAL_CASE_IDIOMS)
+        self._punctuation = constants.PUNC_LIST
+        self._remove_punctuation = constants.REGEX_REMOVE_PUNCTUATION
+
+    def _tokens(self, text):
+        """Split ``text`` like VADER's SentiText: strip one leading or trailing punctuation mark off words."""
+        words_only = {word for word in self._remove_punctuation.sub("", text).split() if len(word) > 1}
+        tokens = []
+        for token in text.split():
+            if len(token) < 2:
+                continue
+            if token not in words_only:
+                for mark in self._punctuation:
+                    if token.startswith(mark) and token[len(mark):] in words_only:
+                        token = token[len(mark):]
+                        break
+                    if token.endswith(mark) and token[:-len(mark)] in words_only:
+                        token = token[:-len(mark)]
+                        break
+            tokens.append(token)
+        return tokens
+
+    def _needs_context(self, lowered):
+        if not self._context_words.isdisjoint(lowered):
+            return True
+        if any("n't" in token for token in lowered):
+            return True
+        # VADER matches idioms on its punctuation-stripped tokens, not the raw text
+        joined = " ".join(lowered)
+        return any(idiom in joined for idiom in self._idioms)
+
+    @staticmethod
+    def _punctuation_emphasis(text):
+        exclamations = min(text.count("!"), 4) * 0.292
+        questions = text.count("?")
+        if questions <= 1:
+            return exclamations
+        return exclamations + (questions * 0.18 if questions <= 3 else 0.96)
+
+    def _context_valences(self, tokens, valences):
+        """
+        Overwrite ``valences`` in place with VADER's context-aware valence of each token.
+
+        Mirrors polarity_scores: boosters and "kind of" score zero, every
+        lexicon word goes through the analyzer's sentiment_valence (using
+        the index of its first occurrence, as VADER does) and words around
+        the first "but" are damped and amplified.
+        """
+        sia = self.sia
+        lowered = [token.lower() for token in tokens]
+        sentitext = SimpleNamespace(
+            words_and_emoticons=tokens,
+            is_cap_diff=0 < len(tokens) - sum(token.isupper() for token in tokens) < len(tokens),
+        )
+        first_index = {}
+        for position, token in enumerate(tokens):
+            first_index.setdefault(token, position)
+        for position, token in enumerate(tokens):
+            word = lowered[position]
+            i = first_index[token]
+            if (i < len(tokens) - 1 and word == "kind" and lowered[i + 1] == "of") or word in self._constants.BOOSTER_DICT:
+                valences[position] = 0.0
+            elif word in sia.lexicon:
+                valences[position] = sia.sentiment_valence(0, sentitext, token, i, [])[0]
+        if "but" in lowered:
+            but = lowered.index("but")
+            valences[:but] *= 0.5
+            valences[but + 1:] *= 1.5
+
+    def compound_scores(self, texts):
+        """
+        Return VADER's compound score for every text.
+
+        Args:
+            texts (list): Texts to score
+
+        Returns:
+            numpy.ndarray: Compound scores in [-1, 1], rounded to 4 places like polarity_scores
+        """
+        texts = [text if isinstance(text, str) else str(text) for text in texts]
+        lengths = np.zeros(len(texts), dtype=np.int64)
+        all_tokens, lowered_tokens, context_texts = [], [], []
+        # Flatten the batch into one token sequence, remembering where context texts start
+        for position, text in enumerate(texts):
+            tokens = self._tokens(text)
+            lowered = [token.lower() for token in tokens]
+            if self._needs_context(lowered):
+                context_texts.append((len(all_tokens), tokens))
+            lengths[position] = len(tokens)
+            all_tokens.extend(tokens)
+            lowered_tokens.extend(lowered)
+
+        index = self._index
+        text_ids = np.repeat(np.arange(len(texts)), lengths)
+        lexicon_ids = np.fromiter((index.get(token, 0) for token in lowered_tokens), dtype=np.int64,
+                                  count=len(lowered_tokens))
+        upper = np.fromiter((token.isupper() for token in all_tokens), dtype=bool, count=len(all_tokens))
+        valences = self._valences[lexicon_ids]
+
+        # ALL-CAPS lexicon words are emphasized when only some of the text's words are capitalized
+        all_caps = np.bincount(text_ids, weights=upper, minlength=len(texts))
+        cap_differential = (all_caps > 0) & (all_caps < lengths)
+        emphasized = upper & cap_differential[text_ids] & (lexicon_ids > 0)
+        valences = valences + emphasized * np.where(valences > 0, self._constants.C_INCR, -self._constants.C_INCR)
+
+        for start, tokens in context_texts:
+            self._context_valences(tokens, valences[start:start + len(tokens)])
+
+        sums = np.bincount(text_ids, weights=valences, minlength=len(texts))
+        emphasis = np.fromiter((self._punctuation_emphasis(text) for text in texts), dtype=float, count=len(texts))
+        sums = sums + np.sign(sums) * emphasis
+        compound = sums / np.sqrt(sums * sums + 15)
+        return np.round(compound, 4)
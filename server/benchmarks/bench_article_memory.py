@@ -0,0 +1,58 @@
+"""
+Compare the memory held by normalized articles stored as dicts and as
+slotted Article objects.
+
+Usage:
+    python benchmarks/bench_article_memory.py [N]   (default 1,000,000)
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from articles import Article
+
+SOURCES = ["CNN", "Fox News", "Reuters", "BBC", "The Guardian", "New York Times", "NPR", "Breitbart"]
+PROVIDERS = ["NewsAPI", "GDELT", "MediaStack", "RSS"]
+
+def _fields(i):
+    # Per-article strings are built up front so both layouts share them and
+    # only the container cost is measured
+    return (
+        SOURCES[i % len(SOURCES)],
+        PROVIDERS[i % len(PROVIDERS)],
+        f"Headline number {i}",
+        f"Description of article {i}",
+        f"https://example.com/story/{i}",
+        "2024-01-01T00:00:00Z",
+    )
+
+def _measure(build, rows):
+    tracemalloc.start()
+    items = [build(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, size
+
+def _as_dict(row):
+    source, provider, title, description, url, published = row
+    return {"source": source, "provider": provider, "title": title,
+            "description": description, "url": url, "published": published}
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = [_fields(i) for i in range(n)]
+
+    dicts, dict_bytes = _measure(_as_dict, rows)
+    del dicts
+    articles, article_bytes = _measure(lambda row: Article(*row), rows)
+    del articles
+
+    print(f"{n} articles")
+    print(f"  dict:    {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / n:.0f} B/article)")
+    print(f"  Article: {article_bytes / 2**20:8.1f} MiB ({article_bytes / n:.0f} B/article)")
+    print(f"  saving:  {1 - article_bytes / dict_bytes:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare per-text VADER polarity_scores against BatchVader's vectorized
+compound scores, checking that both give the same results.
+
+Usage:
+    python benchmarks/bench_batch_sentiment.py [N]   (default 20,000)
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_sentiment import BatchVader
+from nlp_models import get_sia
+
+FILLER = ("the government said on monday that officials would meet again next week to discuss "
+          "talks after markets fell sharply amid concerns over growth and trade").split()
+
+# Negations, boosters and "but" clauses that send lexicon words through VADER's context rules
+CONTEXT_FILLER = FILLER + "very not but this so never least kind of just don't isn't without".split()
+
+def _corpus(n, filler, lexicon, seed=0):
+    """Synthetic title + description texts, about one word in eight carrying sentiment."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        words = [rng.choice(lexicon) if rng.random() < 0.12 else rng.choice(filler)
+                 for _ in range(rng.randint(15, 50))]
+        if rng.random() < 0.05:
+            words[0] = words[0].upper()
+        texts.append(" ".join(words) + rng.choice(["", ".", "!", "?"]))
+    return texts
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    sia = get_sia()
+    batch_vader = BatchVader(sia)
+    lexicon = list(sia.lexicon)
+    for name, filler in (("plain", FILLER), ("context-heavy", CONTEXT_FILLER)):
+        texts = _corpus(n, filler, lexicon)
+
+        started = time.perf_counter()
+        reference = np.array([sia.polarity_scores(text)["compound"] for text in texts])
+        reference_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        batched = batch_vader.compound_scores(texts)
+        batched_elapsed = time.perf_counter() - started
+
+        print(f"{n} {name} articles")
+        print(f"  polarity_scores: {reference_elapsed:6.2f}s ({n / reference_elapsed:,.0f} articles/s)")
+        print(f"  BatchVader:      {batched_elapsed:6.2f}s ({n / batched_elapsed:,.0f} articles/s)")
+        print(f"  speed-up:        {reference_elapsed / batched_elapsed:.1f}x")
+        print(f"  max difference:  {np.abs(reference - batched).max():.4f}")
+
+if __name__ == "__main__":
+    main()
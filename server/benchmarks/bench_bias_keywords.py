@@ -0,0 +1,65 @@
+"""
+Compare calculate_bias_score's keyword matching against the previous
+per-keyword substring scan.
+
+Usage:
+    python benchmarks/bench_bias_keywords.py [N]   (default 100,000)
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bias_lexicon import bias_keyword_automaton, left_leaning_keywords, right_leaning_keywords
+
+FILLER = ("the government said on monday that officials would meet again next week to discuss "
+          "the reunion of talks after markets fell sharply amid concerns over growth and trade").split()
+
+def legacy_counts(text):
+    """The previous implementation: one lowercased substring scan per keyword."""
+    text = text.lower()
+    left_count = sum(1 for keyword in left_leaning_keywords if keyword.lower() in text)
+    right_count = sum(1 for keyword in right_leaning_keywords if keyword.lower() in text)
+    return left_count, right_count
+
+def automaton_counts(text):
+    counts = bias_keyword_automaton.count(text)
+    return counts["left"], counts["right"]
+
+def _corpus(n, keyword_share, seed=0):
+    """Synthetic title + description texts; ``keyword_share`` of them mention 1-3 lexicon keywords."""
+    rng = random.Random(seed)
+    keywords = left_leaning_keywords + right_leaning_keywords
+    texts = []
+    for _ in range(n):
+        words = rng.choices(FILLER, k=rng.randint(25, 60))
+        mentions = rng.randint(1, 3) if rng.random() < keyword_share else 0
+        for _ in range(mentions):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(keywords))
+        texts.append(" ".join(words))
+    return texts
+
+def _run(count, texts):
+    started = time.perf_counter()
+    results = [count(text) for text in texts]
+    return results, time.perf_counter() - started
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for keyword_share in (0.1, 0.75):
+        texts = _corpus(n, keyword_share)
+
+        legacy, legacy_elapsed = _run(legacy_counts, texts)
+        automaton, automaton_elapsed = _run(automaton_counts, texts)
+        differing = sum(1 for old, new in zip(legacy, automaton) if old != new)
+
+        print(f"{n} articles, {keyword_share:.0%} mentioning keywords")
+        print(f"  substring scan: {legacy_elapsed:6.2f}s ({n / legacy_elapsed:,.0f} articles/s)")
+        print(f"  automaton:      {automaton_elapsed:6.2f}s ({n / automaton_elapsed:,.0f} articles/s)")
+        print(f"  speed-up:       {legacy_elapsed / automaton_elapsed:.1f}x")
+        print(f"  differing counts: {differing} (substring false hits such as \"union\" in \"reunion\")")
+
+if __name__ == "__main__":
+    main()
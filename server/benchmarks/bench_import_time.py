@@ -0,0 +1,65 @@
+"""
+Measure how long importing the pipeline's entry modules takes in a fresh interpreter.
+
+Usage:
+    python benchmarks/bench_import_time.py [module ...] [--runs N] [--top K]
+
+Defaults to main, article_analyser and preprocessing. Each module is
+imported in its own subprocess ``--runs`` times; the median wall time
+is reported along with the slowest imports from ``python -X importtime``.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ["main", "article_analyser", "preprocessing"]
+
+def _import_once(module):
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - started)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SERVER_DIR, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr.strip()}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+def _slowest_imports(module, top):
+    """Return the ``top`` direct imports of ``module`` with the largest cumulative time, as (microseconds, name)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=SERVER_DIR, capture_output=True, text=True)
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # importtime indents nested imports by two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            timings.append((int(cumulative), name.strip()))
+    return sorted(timings, reverse=True)[:top]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            times = [_import_once(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(e)
+            continue
+        print(f"import {module}: median {statistics.median(times) * 1000:.0f} ms "
+              f"(min {min(times) * 1000:.0f} ms, {args.runs} runs)")
+        for micros, name in _slowest_imports(module, args.top):
+            print(f"  {micros / 1000:8.1f} ms  {name}")
+
+if __name__ == "__main__":
+    main()
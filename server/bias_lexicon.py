@@ -0,0 +1,23 @@
+from keyword_automaton import KeywordAutomaton
+
+# Political bias dictionaries - more comprehensive for better classification
+left_leaning_keywords = [
+    "progressive", "liberal", "democrat", "socialism", "social justice", 
+    "equality", "diversity", "inclusion", "climate change", "renewable energy",
+    "gun control", "abortion rights", "pro-choice", "LGBTQ+ rights", "universal healthcare",
+    "tax the rich", "wealth tax", "welfare", "regulation", "union", "labor rights",
+    "immigration reform", "racial justice", "defund police", "income inequality",
+    "green new deal", "student loan forgiveness", "living wage"
+]
+
+right_leaning_keywords = [
+    "conservative", "republican", "free market", "capitalism", "traditional values",
+    "tax cuts", "deregulation", "second amendment", "pro-life", "religious freedom",
+    "border security", "national security", "military spending", "law and order",
+    "small government", "family values", "patriotism", "american exceptionalism",
+    "tough on crime", "deficit reduction", "individual liberty", "personal responsibility",
+    "school choice", "free speech", "constitutional originalism"
+]
+
+# Both lexicons compiled once into a single word-boundary matcher
+bias_keyword_automaton = KeywordAutomaton({"left": left_leaning_keywords, "right": right_leaning_keywords})
@@ -0,0 +1,157 @@
+import os
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from api_scripts.state_store import load_state, save_state
+
+# Where the newest seen publication time per source/query is kept between runs
+CURSOR_STORE_PATH = os.getenv("INGEST_CURSOR_STORE", "./data/ingest_cursors.json")
+
+# Publication timestamp field of each provider's raw articles, in lookup order
+PUBLISHED_FIELDS = (
+    "publishedAt",          # NewsAPI
+    "webPublicationDate",   # The Guardian
+    "pub_date",             # NY Times
+    "published_at",         # MediaStack
+    "seendate",             # GDELT
+    "published",            # Currents, Google News, RSS
+)
+
+# Timestamp layouts datetime.fromisoformat rejects before Python 3.11: NYT's "+0000" offsets,
+# fractions other than 3 or 6 digits, GDELT's basic format and Currents' spaced offset
+PUBLISHED_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y%m%dT%H%M%S%z",
+    "%Y-%m-%d %H:%M:%S %z",
+)
+
+_FALLBACK_PARSERS = tuple(
+    (lambda value, layout=layout: datetime.strptime(value, layout)) for layout in PUBLISHED_FORMATS
+) + (parsedate_to_datetime,)
+
+def parse_published(value):
+    """
+    Parse a provider timestamp into an aware UTC datetime.
+
+    Handles ISO 8601 (with or without offset or trailing Z, including
+    NYT's "+0000" offsets), GDELT's "YYYYMMDDTHHMMSSZ", RFC 822 dates
+    from RSS, and Currents' "YYYY-MM-DD HH:MM:SS +0000". Returns None for
+    anything else.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    parsed = None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        for parse in _FALLBACK_PARSERS:
+            try:
+                parsed = parse(value)
+                break
+            except (TypeError, ValueError):
+                continue
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+def article_published(article):
+    """Return the parsed publication time of a raw provider article, if it has one."""
+    for field in PUBLISHED_FIELDS:
+        published = parse_published(article.get(field))
+        if published is not None:
+            return published
+    return None
+
+def at_or_before(mark):
+    """Return a predicate telling whether a raw article was published at or before ``mark``."""
+    def reached(article):
+        published = article_published(article)
+        return published is not None and published <= mark
+    return reached
+
+class CursorStore:
+    """
+    Persistent high-water marks: the newest publication time seen per source and query.
+
+    Marks advanced while batches are filtered stay pending: ``get`` keeps
+    returning the committed marks until ``save``, which the pipeline calls
+    once a run has been fully processed, commits and writes them. A failed
+    run calls ``rollback`` and re-fetches its window instead of losing it.
+    """
+
+    def __init__(self, path=CURSOR_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cursors = load_state(path)
+        self._pending = {}
+
+    @staticmethod
+    def _key(source, query):
+        return f"{source}|{query or ''}"
+
+    def get(self, source, query=None):
+        with self._lock:
+            return parse_published(self._cursors.get(self._key(source, query)))
+
+    def filter_new(self, source, query, articles, newest_first=False):
+        """
+        Keep only articles newer than the stored mark and advance it (pending until ``save``).
+
+        Articles without a parseable timestamp are kept, since there is no
+        way to tell whether they are new. When ``query`` is None, articles
+        carrying a "feed" name get a separate mark per feed, so a slow
+        outlet is never cut off by a busier one in the same crawl.
+
+        ``newest_first`` sources answer from an inclusive lower bound at the
+        mark, newest items first, so a batch without any item at or before
+        the mark was cut short by the fetch budget. The mark then only
+        moves to the oldest item fetched, and the possible gap is logged,
+        instead of jumping to the newest item over articles never fetched.
+        """
+        groups = {}
+        for article in articles:
+            group = query if query is not None else article.get("feed")
+            groups.setdefault(group, []).append(article)
+
+        fresh = []
+        for group, group_articles in groups.items():
+            since = self.get(source, group)
+            newest = since
+            oldest = None
+            reached = since is None or not newest_first
+            for article in group_articles:
+                published = article_published(article)
+                if published is None or since is None or published > since:
+                    fresh.append(article)
+                if published is not None and (newest is None or published > newest):
+                    newest = published
+                if published is not None and (oldest is None or published < oldest):
+                    oldest = published
+                if published is not None and since is not None and published <= since:
+                    reached = True
+            if not reached and oldest is not None:
+                print(f"{source} [{group}]: fetch budget ran out before the high-water mark; articles "
+                      f"published between {since.isoformat()} and {oldest.isoformat()} may have been missed "
+                      f"(raise FETCH_CATCH_UP_PAGES)")
+                newest = oldest
+            if newest is not None and newest != since:
+                with self._lock:
+                    self._pending[self._key(source, group)] = newest.isoformat()
+        return fresh
+
+    def save(self):
+        """Commit the pending marks and write every mark to disk."""
+        with self._lock:
+            self._cursors.update(self._pending)
+            self._pending.clear()
+            save_state(self.path, self._cursors)
+
+    def rollback(self):
+        """Drop the pending marks, so the next run fetches the same window again."""
+        with self._lock:
+            self._pending.clear()
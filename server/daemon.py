@@ -0,0 +1,129 @@
+import os
+import random
+import signal
+import threading
+import time
+
+import nlp_models
+from cursors import CursorStore
+from firebase.firebase_config import get_db
+from main import build_fetchers, run_cycle
+from query_scheduler import load_queries
+from seen_urls import SeenUrlStore
+
+# Polling interval bounds in seconds, and the interval a source starts with
+MIN_INTERVAL = float(os.getenv("POLL_MIN_INTERVAL", "120"))
+MAX_INTERVAL = float(os.getenv("POLL_MAX_INTERVAL", "3600"))
+INITIAL_INTERVAL = float(os.getenv("POLL_INITIAL_INTERVAL", "600"))
+
+# How many new articles we aim to pick up per poll of a source
+TARGET_ITEMS_PER_POLL = 10
+
+# Quiet sources back off by this factor per empty poll
+BACKOFF_FACTOR = 1.5
+
+# Weight of the latest poll in the smoothed arrival rate
+RATE_SMOOTHING = 0.3
+
+# Relative jitter applied to every interval so polls don't fire in lockstep
+JITTER = 0.1
+
+class AdaptiveInterval:
+    """
+    Polling interval for one source, driven by how fast it produces new items.
+
+    Keeps an exponentially smoothed estimate of new articles per second and
+    aims each poll at TARGET_ITEMS_PER_POLL: busy sources tighten towards
+    MIN_INTERVAL, while empty polls back off geometrically towards MAX_INTERVAL.
+    """
+
+    def __init__(self, interval=INITIAL_INTERVAL):
+        self.interval = interval
+        self.rate = None
+        self.last_poll = None
+
+    def record(self, new_items, now=None):
+        now = time.monotonic() if now is None else now
+        elapsed = self.interval if self.last_poll is None else max(now - self.last_poll, 1.0)
+        self.last_poll = now
+
+        observed = new_items / elapsed
+        self.rate = observed if self.rate is None else RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * self.rate
+
+        if new_items == 0:
+            interval = self.interval * BACKOFF_FACTOR
+        else:
+            interval = TARGET_ITEMS_PER_POLL / self.rate if self.rate > 0 else MAX_INTERVAL
+        self.interval = min(MAX_INTERVAL, max(MIN_INTERVAL, interval))
+
+    def next_delay(self):
+        return self.interval * random.uniform(1 - JITTER, 1 + JITTER)
+
+def warm_up():
+    """Load the NLP models and the Firebase client up front, so the first poll doesn't pay for them."""
+    nlp_models.warm_up()
+    get_db()
+
+def run_daemon(queries=None, stop_event=None):
+    """
+    Poll every source on its own adaptive interval until stopped.
+
+    Sources that fall due together are fetched in one concurrent cycle and
+    their new articles analyzed and uploaded together. Cursors stay in
+    memory between cycles and are saved after each one, as is the
+    seen-URL store; a failed cycle rolls its cursor moves back, so its
+    window is fetched again on the next poll, and leaves the polling
+    intervals as they were.
+
+    Args:
+        queries (list, optional): Search terms, defaults to load_queries()
+        stop_event (threading.Event, optional): Set to stop after the current cycle
+    """
+    queries = queries or load_queries()
+    stop_event = stop_event or threading.Event()
+    cursors = CursorStore()
+    seen = SeenUrlStore()
+
+    query_fetchers, static_fetchers = build_fetchers()
+    sources = list(query_fetchers) + list(static_fetchers)
+    intervals = {source: AdaptiveInterval() for source in sources}
+
+    # Stagger the first polls across the jitter window
+    now = time.monotonic()
+    next_due = {source: now + random.uniform(0, JITTER * INITIAL_INTERVAL) for source in sources}
+
+    print(f"Polling {len(sources)} sources for {len(queries)} queries.")
+    while not stop_event.is_set():
+        wait = max(0.0, min(next_due.values()) - time.monotonic())
+        if stop_event.wait(wait):
+            break
+
+        now = time.monotonic()
+        due = [source for source in sources if next_due[source] <= now]
+        try:
+            new_counts = run_cycle(queries, cursors, sources=due, seen=seen)
+        except Exception as e:
+            print(f"Error in polling cycle for {', '.join(due)}: {e}")
+            # A failed cycle says nothing about how busy the sources are: retry
+            # at the current intervals instead of backing off as if they were quiet
+            finished = time.monotonic()
+            for source in due:
+                next_due[source] = finished + intervals[source].next_delay()
+                print(f"{source}: cycle failed, next poll in {intervals[source].interval:.0f}s")
+            continue
+
+        finished = time.monotonic()
+        for source in due:
+            intervals[source].record(new_counts.get(source, 0), finished)
+            next_due[source] = finished + intervals[source].next_delay()
+            print(f"{source}: {new_counts.get(source, 0)} new, next poll in {intervals[source].interval:.0f}s")
+
+    print("Polling daemon stopped.")
+
+if __name__ == "__main__":
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+
+    warm_up()
+    run_daemon(stop_event=stop)
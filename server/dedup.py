@@ -0,0 +1,118 @@
+import base64
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "cmpid", "mc_cid", "mc_eid"}
+
+# Hosts whose links are redirects to the real article
+GOOGLE_NEWS_HOSTS = {"news.google.com", "www.google.com", "google.com"}
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_EMBEDDED_URL = re.compile(rb"https?://[\x21-\x7e]+")
+
+def _unwrap_google_news(parts):
+    """
+    Return the publisher URL behind a Google News link, or None if it cannot be recovered offline.
+
+    Handles ``/url?url=…`` / ``?q=…`` redirects and the older
+    ``/rss/articles/<id>`` links whose base64 id embeds the target URL.
+    Newer opaque ids are left alone.
+    """
+    for name, value in parse_qsl(parts.query):
+        if name in ("url", "q") and value.startswith(("http://", "https://")):
+            return value
+    segments = parts.path.rstrip("/").split("/")
+    if "articles" in segments[:-1]:
+        token = segments[-1]
+        try:
+            decoded = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        except ValueError:
+            return None
+        match = _EMBEDDED_URL.search(decoded)
+        if match:
+            return match.group().decode("ascii")
+    return None
+
+def canonicalize_url(url):
+    """
+    Reduce an article URL to a canonical form shared by every copy of the story.
+
+    Unwraps Google News redirects, lowercases scheme and host, drops default
+    ports, fragments, ``utm_*`` and other tracking parameters, and sorts
+    the remaining query so parameter order does not matter.
+
+    Args:
+        url (str): URL as returned by the provider
+
+    Returns:
+        str: The canonical URL, or the input unchanged if it is not an http(s) URL
+    """
+    if not url or not isinstance(url, str):
+        return url
+    parts = urlsplit(url.strip())
+    if parts.scheme.lower() not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+    if parts.hostname in GOOGLE_NEWS_HOSTS:
+        target = _unwrap_google_news(parts)
+        if target:
+            parts = urlsplit(target)
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+def url_hash(url):
+    """Return a 64-bit hash of a canonical URL, used as the dedup index key."""
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big")
+
+def _merge(kept, duplicate):
+    """Fold a duplicate into the kept record: union of providers, fill in missing fields."""
+    if duplicate.provider not in kept.providers:
+        kept.providers += (duplicate.provider,)
+    # Prefer a real outlet name over the provider fallback
+    if kept.source == kept.provider and duplicate.source != duplicate.provider:
+        kept.source = duplicate.source
+    kept.title = kept.title or duplicate.title
+    kept.description = kept.description or duplicate.description
+    kept.published = kept.published or duplicate.published
+
+def dedupe_articles(articles):
+    """
+    Collapse articles that point at the same canonical URL into one record.
+
+    Each kept article has its URL canonicalized and lists every provider
+    that carried it in ``providers``, so the story is analyzed and
+    uploaded once. Articles without a URL are kept as they are.
+
+    Args:
+        articles (list): Normalized Article objects, in priority order
+
+    Returns:
+        list: The unique articles, in first-seen order
+    """
+    index = {}
+    unique = []
+    for article in articles:
+        article.url = canonicalize_url(article.url)
+        if not article.providers:
+            article.providers = (article.provider,)
+        if not article.url:
+            unique.append(article)
+            continue
+        key = url_hash(article.url)
+        kept = index.get(key)
+        if kept is None:
+            index[key] = article
+            unique.append(article)
+        else:
+            _merge(kept, article)
+    print(f"Deduplicated {len(articles)} articles to {len(unique)} unique URLs.")
+    return unique
@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Upper bound on simultaneous provider calls; every fetcher is network bound
+DEFAULT_MAX_WORKERS = 8
+
+def _run_job(name, job):
+    """Run a single fetch job, timing it and isolating any failure."""
+    started = time.perf_counter()
+    try:
+        articles = job() or []
+    except Exception as e:
+        print(f"Error fetching from {name}: {e}")
+        articles = []
+    elapsed = time.perf_counter() - started
+    return name, articles, elapsed
+
+def fetch_all_sources(jobs, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Run every source fetcher at once on a bounded thread pool.
+
+    A failing source is logged and contributes an empty list, so one
+    provider can never take down the whole fetch phase.
+
+    Args:
+        jobs (dict): Mapping of source name to a zero-argument callable returning a list of articles
+        max_workers (int): Maximum number of fetchers running concurrently
+
+    Returns:
+        dict: Mapping of source name to its fetched articles, in the order of ``jobs``
+    """
+    if not jobs:
+        return {}
+
+    results = {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = [executor.submit(_run_job, name, job) for name, job in jobs.items()]
+        for future in as_completed(futures):
+            name, articles, elapsed = future.result()
+            results[name] = articles
+            print(f"{name}: {len(articles)} articles in {elapsed:.2f}s")
+
+    elapsed = time.perf_counter() - started
+    total = sum(len(articles) for articles in results.values())
+    print(f"Fetched {total} articles from {len(jobs)} sources in {elapsed:.2f}s ({total / elapsed:.0f} articles/s).")
+    return {name: results[name] for name in jobs}
@@ -1,9 +1,35 @@
-import firebase_admin
-from firebase_admin import credentials, firestore
+import threading
 
-# Initialize Firebase app
-cred = credentials.Certificate("./firebase/biaslens-2782f-firebase-adminsdk-sfe59-ebb73541fd.json")
-firebase_admin.initialize_app(cred)
+# Service account key for the project's Firebase app
+CREDENTIALS_PATH = "./firebase/biaslens-2782f-firebase-adminsdk-sfe59-ebb73541fd.json"
 
-# Get Firestore client
-db = firestore.client()
+_db = None
+_db_lock = threading.Lock()
+
+def get_db():
+    """
+    Return the Firestore client, initializing the Firebase app on first use.
+
+    firebase_admin is only imported here, so modules that merely import
+    the uploader stay cheap to load.
+    """
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                import firebase_admin
+                from firebase_admin import credentials, firestore
+
+                # Initialize Firebase app
+                cred = credentials.Certificate(CREDENTIALS_PATH)
+                firebase_admin.initialize_app(cred)
+
+                # Get Firestore client
+                _db = firestore.client()
+    return _db
+
+def __getattr__(name):
+    # Keep ``from firebase.firebase_config import db`` working, lazily
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,37 @@
-import json
+from firebase.firebase_config import get_db
+from jsonl import read_jsonl
 
-from firebase.firebase_config import db
+def upload_stream(articles):
+    """
+    Upload analyzed articles to Firestore as they arrive.
 
-def upload_to_firestore(input_file):
-    # Load articles from the JSON file
-    with open(input_file, "r") as file:
-        articles = json.load(file)
+    Args:
+        articles (iterable): Analyzed article dicts, e.g. from analyze_stream
 
+    Returns:
+        tuple: ``(uploaded, failed)``, the URLs of the articles actually
+        uploaded and the number of documents that failed
+    """
     # Reference Firestore collection
-    collection_ref = db.collection("Articles")
+    collection_ref = get_db().collection("Articles")
 
     # Upload each article as a document
+    uploaded = []
+    failed = 0
     for article in articles:
         try:
             # Use URL as document ID to avoid duplicates
             doc_id = article.get("url", "").replace("https://", "").replace("/", "_")
             collection_ref.document(doc_id).set(article)
+            uploaded.append(article.get("url"))
             print(f"Uploaded article: {article['title']}")
         except Exception as e:
             print(f"Error uploading article: {e}")
+            failed += 1
+
+    print(f"Uploaded {len(uploaded)} articles to Firestore ({failed} failed).")
+    return uploaded, failed
 
-    print(f"Uploaded {len(articles)} articles to Firestore.")
+def upload_to_firestore(input_file):
+    # Stream articles from the JSON Lines file, one at a time
+    return upload_stream(read_jsonl(input_file))
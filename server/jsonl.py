@@ -0,0 +1,70 @@
+import gzip
+import io
+import json
+from contextlib import contextmanager
+
+# Compression picked from the file extension
+GZIP_SUFFIX = ".gz"
+ZSTD_SUFFIX = ".zst"
+
+@contextmanager
+def open_jsonl(path, mode="r"):
+    """
+    Open a JSON Lines file as text, compressing by extension (.gz or .zst).
+
+    zstd support needs the optional ``zstandard`` package, imported only
+    when a .zst path is used.
+    """
+    if path.endswith(GZIP_SUFFIX):
+        with gzip.open(path, mode + "t", encoding="utf-8") as file:
+            yield file
+    elif path.endswith(ZSTD_SUFFIX):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(f"Reading or writing {path} needs the zstandard package") from e
+        with open(path, mode + "b") as raw:
+            if mode == "r":
+                stream = zstandard.ZstdDecompressor().stream_reader(raw)
+            else:
+                stream = zstandard.ZstdCompressor().stream_writer(raw)
+            with io.TextIOWrapper(stream, encoding="utf-8") as file:
+                yield file
+    else:
+        with open(path, mode, encoding="utf-8") as file:
+            yield file
+
+def read_jsonl(path):
+    """
+    Yield the records of a JSON Lines file one at a time.
+
+    Blank lines are ignored and malformed lines are reported and skipped,
+    so one bad record never loses the rest of the batch.
+    """
+    with open_jsonl(path, "r") as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Skipping malformed record on line {line_number} of {path}: {e}")
+
+def write_jsonl(path, records):
+    """
+    Write records to a JSON Lines file as they are produced.
+
+    Args:
+        path (str): Output path; a .gz or .zst suffix compresses the stream
+        records (iterable): JSON-serializable records, consumed lazily
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    with open_jsonl(path, "w") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            file.write("\n")
+            count += 1
+    return count
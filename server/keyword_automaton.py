@@ -0,0 +1,106 @@
+import string
+from collections import deque
+
+# Byte table that lowercases ASCII letters and turns every ASCII character other than
+# letters, digits and "+" (as in "LGBTQ+") into a space, so hyphens and punctuation are
+# word boundaries; non-ASCII bytes are kept as part of their word
+_WORD_BYTES = set((string.ascii_letters + string.digits + "+").encode("ascii")) | set(range(128, 256))
+_BOUNDARY_TABLE = bytes(byte if byte in _WORD_BYTES else 0x20 for byte in range(256)).lower()
+
+# Non-ASCII spaces, dashes and quotes, mapped to spaces before encoding
+_UNICODE_BOUNDARIES = str.maketrans(dict.fromkeys("\u00a0\u00ab\u00bb\u2010\u2011\u2012\u2013\u2014\u2015\u2018\u2019\u201c\u201d\u2026", " "))
+
+def tokenize(text):
+    """
+    Split ``text`` into the lowercase word tokens keywords are matched on.
+
+    Works on UTF-8 bytes: one C-level translate and split, with no regex
+    or per-character Python work.
+    """
+    if not text.isascii():
+        text = text.lower().translate(_UNICODE_BOUNDARIES)
+    return text.encode("utf-8", "ignore").translate(_BOUNDARY_TABLE).split()
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over word tokens for a set of labelled keyword lexicons.
+
+    Keywords (single words or phrases) are compiled once; matching a text
+    is then a single pass over its tokens, however many keywords there
+    are. Because the automaton steps a whole word at a time, keywords
+    only match on word boundaries: "union" matches "union" or "unions"
+    but not "reunion".
+    """
+
+    def __init__(self, lexicons, plurals=True):
+        """
+        Args:
+            lexicons (dict): Mapping of label to a list of keywords
+            plurals (bool): Also match keywords whose last word takes a plural "s"
+        """
+        self.labels = list(lexicons)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        for label, keywords in lexicons.items():
+            for keyword in keywords:
+                words = tokenize(keyword)
+                if not words:
+                    continue
+                entry = (label, b" ".join(words).decode("utf-8"))
+                self._add(words, entry)
+                if plurals and not words[-1].endswith((b"s", b"+")):
+                    self._add(words[:-1] + [words[-1] + b"s"], entry)
+        self._link()
+        # Every match starts with one of these, so texts containing none are skipped outright
+        self._first_words = frozenset(self._goto[0])
+
+    def _add(self, words, entry):
+        state = 0
+        for word in words:
+            nxt = self._goto[state].get(word)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][word] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = self._output[state] + (entry,)
+
+    def _link(self):
+        """Breadth-first pass computing failure links and merging outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def matches(self, text):
+        """Return the set of ``(label, keyword)`` pairs occurring in ``text``."""
+        words = tokenize(text)
+        found = set()
+        if self._first_words.isdisjoint(words):
+            return found
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for word in words:
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def count(self, text):
+        """Return how many distinct keywords of each label occur in ``text``."""
+        counts = dict.fromkeys(self.labels, 0)
+        for label, _ in self.matches(text):
+            counts[label] += 1
+        return counts
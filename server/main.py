@@ -1,118 +1,156 @@
-import json
 import os
 from dotenv import load_dotenv
-from api_scripts.newsapi import fetch_newsapi_articles
-from api_scripts.ny_times import fetch_nyt_news
-from api_scripts.theguardian import fetch_guardian_news
-from api_scripts.res_scraper import fetch_rss_articles
-from api_scripts.mediastack import fetch_mediastack_news
-from api_scripts.gdelt_project import fetch_gdelt_news
-from api_scripts.google_news import fetch_google_news_rss
-from api_scripts.currents import fetch_currents_news
-from article_analyser import analyze_articles_with_bias, determine_political_bias
-from firebase.firebase_functions import upload_to_firestore
+from api_scripts.feed_cache import get_validator_store
+from api_scripts.registry import SOURCES_BY_NAME, enabled_sources
+from articles import map_generic
+from article_analyser import analyze_articles_with_bias, analyze_stream, determine_political_bias
+from firebase.firebase_functions import upload_stream, upload_to_firestore
+from query_scheduler import load_queries, fan_out_queries
+from cursors import CursorStore
+from seen_urls import SeenUrlStore
+from dedup import canonicalize_url, dedupe_articles
+from near_duplicates import cluster_articles
+from jsonl import read_jsonl, write_jsonl
+from archive import append_to_archive, archive_stream
+from article_store.store import store_stream
 
 # Load environment variables from .env file
 load_dotenv()
 
-def normalize_articles(source, articles):
+def normalize_articles(source, articles, seen=None):
+    spec = SOURCES_BY_NAME.get(source)
+    mapper = spec.load_mapper() if spec else (lambda raw: map_generic(raw, source))
     normalized = []
+    already_seen = 0
     for article in articles:
         if isinstance(article, dict):  # Check if article is a dict
-            normalized.append({
-                "source": source,
-                "title": article.get("title") or article.get("headline", {}).get("main"),
-                "description": article.get("description") or article.get("summary"),
-                "url": article.get("url") or article.get("link"),
-                "published": article.get("publishedAt") or article.get("published")
-            })
+            article = mapper(article)
+            article.url = canonicalize_url(article.url)
+            # Providers re-emit old items; drop anything a previous run already processed
+            if seen is not None and article.url and article.url in seen:
+                already_seen += 1
+                continue
+            normalized.append(article)
         else:
             print(f"Skipping non-dict article from {source}: {article}")
+    if already_seen:
+        print(f"Skipping {already_seen} already processed articles from {source}.")
     return normalized
 
-if __name__ == "__main__":
-    # Define API keys and parameters
-    NEWSAPI_KEY = os.getenv("NEWSAPI_KEY")
-    NYT_KEY = os.getenv("NYT_KEY")
-    GUARDIAN_KEY = os.getenv("GUARDIAN_KEY")
-    MEDIASTACK_KEY = os.getenv("MEDIASTACK_KEY")
-    CURRENTS_KEY = os.getenv("CURRENTS_KEY")
-
-    QUERY = "technology"
-    RSS_FEED_URL = "https://rss.cnn.com/rss/edition.rss"
-
-    # Fetch articles
-    try:
-        newsapi_articles = fetch_newsapi_articles(NEWSAPI_KEY, QUERY)
-    except Exception as e:
-        print(f"Error fetching from NewsAPI: {e}")
-        newsapi_articles = []
-
-    try:
-        nyt_articles = fetch_nyt_news(NYT_KEY, QUERY)
-    except Exception as e:
-        print(f"Error fetching from NYT: {e}")
-        nyt_articles = []
-
-    try:
-        guardian_articles = fetch_guardian_news(GUARDIAN_KEY, QUERY)
-    except Exception as e:
-        print(f"Error fetching from The Guardian: {e}")
-        guardian_articles = []
-
-    try:
-        mediastack_articles = fetch_mediastack_news(MEDIASTACK_KEY, QUERY)
-    except Exception as e:
-        print(f"Error fetching from MediaStack: {e}")
-        mediastack_articles = []
-
-    try:
-        gdelt_articles = fetch_gdelt_news(QUERY)
-        gdelt_articles = [{"title": line, "url": ""} for line in gdelt_articles.splitlines() if line.strip()]
-    except Exception as e:
-        print(f"Error fetching from GDELT: {e}")
-        gdelt_articles = []
-
-    try:
-        google_news_articles = fetch_google_news_rss()
-    except Exception as e:
-        print(f"Error fetching from Google News: {e}")
-        google_news_articles = []
-
-    try:
-        currents_articles = fetch_currents_news(CURRENTS_KEY, QUERY)
-    except Exception as e:
-        print(f"Error fetching from Currents API: {e}")
-        currents_articles = []
-
-    try:
-        rss_articles = fetch_rss_articles(RSS_FEED_URL)
-    except Exception as e:
-        print(f"Error fetching from RSS: {e}")
-        rss_articles = []
-
-    # Normalize articles
-    all_articles = []
-    all_articles.extend(normalize_articles("NewsAPI", newsapi_articles))
-    all_articles.extend(normalize_articles("NY Times", nyt_articles))
-    all_articles.extend(normalize_articles("The Guardian", guardian_articles))
-    all_articles.extend(normalize_articles("MediaStack", mediastack_articles))
-    all_articles.extend(normalize_articles("GDELT", gdelt_articles))
-    all_articles.extend(normalize_articles("Google News", google_news_articles))
-    all_articles.extend(normalize_articles("Currents", currents_articles))
-    all_articles.extend(normalize_articles("RSS", rss_articles))
-
-    # Save normalized data
-    with open("./data/all_articles.json", "w") as file:
-        json.dump(all_articles, file, indent=4)
-
+def build_fetchers():
+    """
+    Build the fetch callables for every enabled source from the registry.
+
+    Provider modules are only imported when their fetcher first runs.
+
+    Returns:
+        tuple: ``(query_fetchers, static_fetchers)`` as expected by fan_out_queries
+    """
+    query_fetchers = {}
+    static_fetchers = {}
+    for spec in enabled_sources():
+        target = query_fetchers if spec.query_based else static_fetchers
+        target[spec.name] = spec.fetcher()
+    return query_fetchers, static_fetchers
+
+# Set WRITE_STAGE_FILES=1 to route articles through the stage files on disk for debugging;
+# by default stages are chained in memory
+WRITE_STAGE_FILES = os.getenv("WRITE_STAGE_FILES", "").lower() in ("1", "true", "yes")
+
+# Stage files are JSON Lines; set STAGE_COMPRESSION to "gz" or "zst" to compress them
+STAGE_COMPRESSION = os.getenv("STAGE_COMPRESSION", "")
+_STAGE_SUFFIX = f".{STAGE_COMPRESSION}" if STAGE_COMPRESSION else ""
+NORMALIZED_FILE = f"./data/all_articles.jsonl{_STAGE_SUFFIX}"
+ANALYZED_FILE = f"./data/analyzed_articles.jsonl{_STAGE_SUFFIX}"
+
+def process_articles(all_articles, input_file=NORMALIZED_FILE, output_file=ANALYZED_FILE, stage_files=WRITE_STAGE_FILES):
+    """
+    Analyze normalized articles, upsert them into the local article store,
+    append them to the Parquet archive and upload them to Firestore.
+
+    Articles stream from analysis through the store and archive into the uploader; with
+    ``stage_files`` each stage instead writes its JSON Lines file and the
+    next stage reads it back.
+
+    Returns:
+        tuple: ``(uploaded, failed)``, the URLs uploaded to Firestore and the number of failed uploads
+    """
     print(f"Aggregated and normalized {len(all_articles)} articles from all sources.")
 
-    input_file = "./data/all_articles.json"
-    output_file = "./data/analyzed_articles.json"
+    if not stage_files:
+        return upload_stream(archive_stream(store_stream(analyze_stream(all_articles))))
+
+    # Save normalized data, one record per line
+    write_jsonl(input_file, (article.to_dict() for article in all_articles))
 
     # Perform sentiment analysis
     analyze_articles_with_bias(input_file, output_file)
 
     # Upload analyzed articles to Firestore
-    upload_to_firestore(output_file)
\ No newline at end of file
+    uploaded, failed = upload_to_firestore(output_file)
+
+    # Record this run in the local store and the analytics archive
+    append_to_archive(store_stream(read_jsonl(output_file)))
+    return uploaded, failed
+
+def run_cycle(queries, cursors, sources=None, seen=None):
+    """
+    Fetch, normalize, analyze and upload one cycle of articles.
+
+    Args:
+        queries (list): Search terms for the query-based providers
+        cursors (CursorStore): High-water marks; saved once the cycle is processed, rolled back if it or any upload fails
+        sources (iterable, optional): Only poll these source names (all sources if None)
+        seen (SeenUrlStore, optional): URLs already processed; gains the URLs uploaded this cycle, then saved
+
+    Returns:
+        dict: Mapping of polled source name to the number of new articles it returned
+    """
+    query_fetchers, static_fetchers = build_fetchers()
+    if sources is not None:
+        query_fetchers = {name: fetch for name, fetch in query_fetchers.items() if name in sources}
+        static_fetchers = {name: fetch for name, fetch in static_fetchers.items() if name in sources}
+
+    try:
+        # Fetch articles for every query from every source concurrently
+        fetched = fan_out_queries(queries, query_fetchers, static_fetchers, cursors=cursors)
+
+        # Normalize articles
+        all_articles = []
+        for source, articles in fetched.items():
+            all_articles.extend(normalize_articles(source, articles, seen))
+
+        # Analyze and upload each story once, however many providers carried it
+        all_articles = dedupe_articles(all_articles)
+        # Group syndicated copies so each story's text is analyzed once
+        cluster_articles(all_articles)
+
+        uploaded, failed = process_articles(all_articles) if all_articles else ([], 0)
+    except Exception:
+        # Nothing from this cycle counts as processed; the next one fetches the same window
+        cursors.rollback()
+        get_validator_store().rollback()
+        raise
+
+    if failed:
+        # Fetch the same window again so the failed uploads are retried; the
+        # seen-URL store below keeps the successful ones from going up twice
+        print(f"{failed} uploads failed; keeping the previous high-water marks and feed validators.")
+        cursors.rollback()
+        get_validator_store().rollback()
+    else:
+        # Everything fetched this cycle has been processed; advance the high-water marks
+        # and remember the feed validators, so unchanged feeds answer 304 next time
+        cursors.save()
+        get_validator_store().save()
+    if seen is not None:
+        # Only uploaded articles count as processed; failed uploads are picked up again
+        for url in uploaded:
+            if url:
+                seen.add(url)
+        seen.save()
+    return {source: len(articles) for source, articles in fetched.items()}
+
+if __name__ == "__main__":
+    # Fetch only articles newer than each source's high-water mark
+    run_cycle(load_queries(), CursorStore(), seen=SeenUrlStore())
@@ -0,0 +1,335 @@
+"""
+Local stand-in for every news provider, for load testing without touching live APIs.
+
+Serves NewsAPI, The Guardian, NYT Article Search, MediaStack, Currents, GDELT
+and RSS (including Google News) response shapes from a synthetic corpus that
+is generated on demand, so 10k or 1M articles cost no memory up front.
+
+Run it, then point the pipeline at it:
+
+    python mock_providers.py --articles 1000000 --latency-ms 80 --error-rate 0.01
+    MOCK_PROVIDER_URL=http://127.0.0.1:8765 FETCH_MAX_PAGES=50 python main.py
+
+With MOCK_PROVIDER_URL set, the shared HTTP client sends every request to
+``<mock>/<original host>/<original path>``, bypassing provider rate limits
+and daily quotas.
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+from cursors import parse_published
+
+# Outlets synthetic articles are attributed to (name, domain)
+OUTLETS = [
+    ("CNN", "cnn.com"), ("Fox News", "foxnews.com"), ("Reuters", "reuters.com"),
+    ("The Guardian", "theguardian.com"), ("New York Times", "nytimes.com"),
+    ("Breitbart", "breitbart.com"), ("BBC", "bbc.co.uk"), ("NPR", "npr.org"),
+    ("The Hill", "thehill.com"), ("Local Gazette", "localgazette.example"),
+]
+
+WORDS = (
+    "economy election policy climate market senate court border energy health "
+    "report growth tax reform vote union security technology trade budget "
+    "inflation healthcare immigration regulation jobs housing education"
+).split()
+
+# Page sizes each real API allows at most
+MAX_PAGE_SIZE = {"newsapi": 100, "guardian": 50, "nyt": 10, "mediastack": 100, "currents": 200, "gdelt": 250}
+
+class Corpus:
+    """
+    Deterministic synthetic article stream, newest first.
+
+    Article ``i`` of a query is published ``i * spacing`` seconds before the
+    server started; with an arrival rate, new articles keep appearing at the
+    head so incremental fetching and adaptive polling have something to find.
+    """
+
+    def __init__(self, size, spacing=60.0, arrival_rate=0.0, description_words=30, seed=0):
+        self.size = size
+        self.spacing = spacing
+        self.arrival_rate = arrival_rate
+        self.description_words = description_words
+        self.seed = seed
+        self.started = time.time()
+
+    def total(self):
+        return self.size + int(self.arrival_rate * (time.time() - self.started))
+
+    def published(self, index):
+        arrived = self.total() - self.size
+        offset = (index - arrived) * self.spacing
+        return datetime.fromtimestamp(self.started - offset, tz=timezone.utc)
+
+    def count_since(self, since):
+        """Number of articles (from the head) published at or after ``since``, like the real APIs' lower bounds."""
+        total = self.total()
+        if since is None:
+            return total
+        newest = self.published(0)
+        newer = math.floor((newest - since).total_seconds() / self.spacing) + 1
+        return max(0, min(total, newer))
+
+    def count_newer(self, moment):
+        """Number of articles (from the head) published strictly after ``moment``."""
+        newest = self.published(0)
+        newer = math.ceil((newest - moment).total_seconds() / self.spacing)
+        return max(0, min(self.total(), newer))
+
+    def article(self, query, index):
+        total = self.total()
+        # Stable identity: count from the tail so existing articles keep their number as new ones arrive
+        serial = total - index
+        rng = random.Random(f"{self.seed}:{query}:{serial}")
+        outlet, domain = OUTLETS[rng.randrange(len(OUTLETS))]
+        title_words = [query] + rng.sample(WORDS, 6)
+        description = " ".join(rng.choice(WORDS) for _ in range(self.description_words))
+        slug = hashlib.sha1(f"{query}:{serial}".encode()).hexdigest()[:12]
+        return {
+            "outlet": outlet,
+            "domain": domain,
+            "title": " ".join(title_words).capitalize(),
+            "description": description.capitalize() + ".",
+            "url": f"https://www.{domain}/{query.replace(' ', '-')}/{slug}?utm_source=mock",
+            "published": self.published(index),
+        }
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def _page_window(total, offset, size):
+    start = min(offset, total)
+    return range(start, min(start + size, total))
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    corpus = None
+    latency_ms = 0.0
+    error_rate = 0.0
+    throttle_rate = 0.0
+    feed_items = 50
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = "/" + path
+
+        if self.latency_ms:
+            time.sleep(random.expovariate(1.0 / self.latency_ms) / 1000.0)
+        if random.random() < self.throttle_rate:
+            return self._send(429, b'{"status":"error","code":"rateLimited"}', "application/json", {"Retry-After": "1"})
+        if random.random() < self.error_rate:
+            return self._send(503, b"Service Unavailable", "text/plain")
+
+        routes = {
+            "newsapi.org": self._newsapi,
+            "content.guardianapis.com": self._guardian,
+            "api.nytimes.com": self._nyt,
+            "api.mediastack.com": self._mediastack,
+            "api.currentsapi.services": self._currents,
+            "api.gdeltproject.org": self._gdelt,
+        }
+        handler = routes.get(host, self._rss)
+        handler(host, path, params)
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, payload):
+        self._send(200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _slice(self, params, query_key, since_key, offset, size, provider):
+        query = params.get(query_key, "news")
+        since = parse_published(params.get(since_key)) if since_key else None
+        total = self.corpus.count_since(since)
+        size = max(1, min(size, MAX_PAGE_SIZE[provider]))
+        return query, total, [self.corpus.article(query, i) for i in _page_window(total, offset, size)]
+
+    def _newsapi(self, host, path, params):
+        size = int(params.get("pageSize", 100))
+        page = int(params.get("page", 1))
+        query, total, items = self._slice(params, "q", "from", (page - 1) * size, size, "newsapi")
+        self._json({
+            "status": "ok",
+            "totalResults": total,
+            "articles": [{
+                "source": {"id": None, "name": a["outlet"]},
+                "author": None,
+                "title": a["title"],
+                "description": a["description"],
+                "url": a["url"],
+                "publishedAt": _iso(a["published"]),
+                "content": a["description"],
+            } for a in items],
+        })
+
+    def _guardian(self, host, path, params):
+        size = int(params.get("page-size", 10))
+        page = int(params.get("page", 1))
+        query, total, items = self._slice(params, "q", "from-date", (page - 1) * size, size, "guardian")
+        self._json({"response": {
+            "status": "ok",
+            "total": total,
+            "pageSize": size,
+            "currentPage": page,
+            "pages": -(-total // size),
+            "results": [{
+                "id": a["url"].split("/", 3)[-1],
+                "type": "article",
+                "sectionName": "News",
+                "webPublicationDate": _iso(a["published"]),
+                "webTitle": a["title"],
+                "webUrl": a["url"],
+            } for a in items],
+        }})
+
+    def _nyt(self, host, path, params):
+        page = int(params.get("page", 0))
+        begin = params.get("begin_date")
+        if begin:
+            params["begin_date"] = f"{begin[:4]}-{begin[4:6]}-{begin[6:8]}"
+        query, total, items = self._slice(params, "q", "begin_date", page * 10, 10, "nyt")
+        self._json({"status": "OK", "response": {
+            "docs": [{
+                "headline": {"main": a["title"]},
+                "abstract": a["description"],
+                "web_url": a["url"],
+                "pub_date": a["published"].strftime("%Y-%m-%dT%H:%M:%S+0000"),
+                "source": "The New York Times",
+            } for a in items],
+            "meta": {"hits": total, "offset": page * 10},
+        }})
+
+    def _mediastack(self, host, path, params):
+        size = int(params.get("limit", 25))
+        offset = int(params.get("offset", 0))
+        if params.get("date"):
+            params["date"] = params["date"].split(",")[0]
+        query, total, items = self._slice(params, "keywords", "date", offset, size, "mediastack")
+        self._json({
+            "pagination": {"limit": size, "offset": offset, "count": len(items), "total": total},
+            "data": [{
+                "author": None,
+                "title": a["title"],
+                "description": a["description"],
+                "url": a["url"],
+                "source": a["outlet"],
+                "category": "general",
+                "language": "en",
+                "country": "us",
+                "published_at": a["published"].strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+            } for a in items],
+        })
+
+    def _currents(self, host, path, params):
+        size = int(params.get("page_size", 30))
+        page = int(params.get("page_number", 1))
+        query, total, items = self._slice(params, "keywords", "start_date", (page - 1) * size, size, "currents")
+        self._json({"status": "ok", "page": page, "news": [{
+            "id": a["url"].rsplit("/", 1)[-1],
+            "title": a["title"],
+            "description": a["description"],
+            "url": a["url"],
+            "author": a["outlet"],
+            "language": "en",
+            "category": ["general"],
+            "published": a["published"].strftime("%Y-%m-%d %H:%M:%S +0000"),
+        } for a in items]})
+
+    def _gdelt(self, host, path, params):
+        start = params.get("startdatetime")
+        if start:
+            params["startdatetime"] = datetime.strptime(start, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc).isoformat()
+        end = params.get("enddatetime")
+        # Records after the window end are skipped, newest first like sort=datedesc
+        offset = self.corpus.count_newer(datetime.strptime(end, "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)) if end else 0
+        size = int(params.get("maxrecords", 75))
+        query, total, items = self._slice(params, "query", "startdatetime", offset, size, "gdelt")
+        self._json({"articles": [{
+            "url": a["url"],
+            "url_mobile": "",
+            "title": a["title"],
+            "seendate": a["published"].strftime("%Y%m%dT%H%M%SZ"),
+            "socialimage": "",
+            "domain": a["domain"],
+            "language": "English",
+            "sourcecountry": "United States",
+        } for a in items]})
+
+    def _rss(self, host, path, params):
+        feed = f"{host}{path}"
+        items = [self.corpus.article(feed, i) for i in range(min(self.feed_items, self.corpus.total()))]
+        etag = f'"{hashlib.sha1(items[0]["url"].encode()).hexdigest()[:16]}"' if items else '"empty"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        entries = "".join(
+            f"<item><title>{escape(a['title'])}</title><link>{escape(a['url'])}</link>"
+            f"<description>{escape(a['description'])}</description>"
+            f"<pubDate>{format_datetime(a['published'])}</pubDate></item>"
+            for a in items
+        )
+        body = f'<?xml version="1.0"?><rss version="2.0"><channel><title>{escape(feed)}</title>{entries}</channel></rss>'
+        self._send(200, body.encode("utf-8"), "application/rss+xml", {"ETag": etag})
+
+def serve(host="127.0.0.1", port=8765, articles=10_000, latency_ms=0.0, error_rate=0.0, throttle_rate=0.0,
+          description_words=30, arrival_rate=0.0, feed_items=50, seed=0):
+    """Start the mock provider server in a background thread and return it."""
+    handler = type("ConfiguredMockProviderHandler", (MockProviderHandler,), {
+        "corpus": Corpus(articles, arrival_rate=arrival_rate, description_words=description_words, seed=seed),
+        "latency_ms": latency_ms,
+        "error_rate": error_rate,
+        "throttle_rate": throttle_rate,
+        "feed_items": feed_items,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve mock news provider APIs for load testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--articles", type=int, default=10_000, help="Synthetic articles per query")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean response latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--description-words", type=int, default=30, help="Payload size per article")
+    parser.add_argument("--arrival-rate", type=float, default=0.0, help="New articles per second per query")
+    parser.add_argument("--feed-items", type=int, default=50, help="Items per RSS feed")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.articles, args.latency_ms, args.error_rate, args.throttle_rate,
+                   args.description_words, args.arrival_rate, args.feed_items, args.seed)
+    print(f"Mock providers listening on http://{args.host}:{args.port} ({args.articles} articles per query)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
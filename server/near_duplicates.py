@@ -0,0 +1,112 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from dedup import url_hash
+
+# Words per shingle; three keeps a one-word headline edit from touching more than three shingles
+SHINGLE_SIZE = 3
+
+# 128 permutations split into 32 bands of 4 rows: a pair at 0.6 Jaccard shares a band
+# 99% of the time, a pair at 0.2 about 5% of the time (and is then rejected below)
+NUM_PERM = 128
+NUM_BANDS = 32
+
+# Estimated Jaccard similarity a candidate must reach to join a story cluster
+SIMILARITY_THRESHOLD = 0.6
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_WORD = re.compile(r"[a-z0-9]+")
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Return the set of lowercase word n-grams of ``text`` (single words if it is shorter than ``size``)."""
+    words = _WORD.findall((text or "").lower())
+    if len(words) < size:
+        return set(words)
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+class MinHashLSH:
+    """
+    MinHash signatures with a banded locality-sensitive hash index.
+
+    Each insert and query touches one bucket per band, so the cost per
+    article is independent of how many articles are already indexed.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, num_bands=NUM_BANDS, threshold=SIMILARITY_THRESHOLD, seed=1):
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be a multiple of num_bands")
+        rng = np.random.default_rng(seed)
+        # Universal hash family h(x) = (a*x + b) mod p; 31-bit operands keep a*x inside uint64
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self.num_perm = num_perm
+        self.rows = num_perm // num_bands
+        self.threshold = threshold
+        self._bands = [defaultdict(list) for _ in range(num_bands)]
+        self._signatures = {}
+
+    def signature(self, text):
+        """Return the MinHash signature of ``text``, or None if it has no words."""
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams))
+        hashes %= _MERSENNE_PRIME
+        return ((self._a * hashes + self._b) % _MERSENNE_PRIME).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature):
+        for band in range(len(self._bands)):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, key, signature):
+        self._signatures[key] = signature
+        for band, bucket in self._band_keys(signature):
+            self._bands[band][bucket].append(key)
+
+    def query(self, signature):
+        """Return ``(key, similarity)`` of the most similar indexed entry above the threshold, or None."""
+        candidates = set()
+        for band, bucket in self._band_keys(signature):
+            candidates.update(self._bands[band].get(bucket, ()))
+        best = None
+        for key in candidates:
+            similarity = float(np.count_nonzero(self._signatures[key] == signature)) / self.num_perm
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+def cluster_articles(articles, index=None):
+    """
+    Group near-duplicate articles (syndicated wire copy, lightly edited headlines) into stories.
+
+    Each article's title and description are MinHashed and looked up in
+    the LSH index; a match joins the matched article's story, otherwise
+    the article starts a new one. ``story_id`` is set on every article
+    and is derived from the URL of the story's first article.
+
+    Args:
+        articles (list): Deduplicated Article objects
+        index (MinHashLSH, optional): Index to cluster into, e.g. one kept across cycles
+
+    Returns:
+        dict: Mapping of story id to the number of articles in it
+    """
+    index = index or MinHashLSH()
+    stories = {}
+    for position, article in enumerate(articles):
+        article.story_id = f"{url_hash(article.url):016x}" if article.url else f"story-{position}"
+        signature = index.signature(f"{article.title or ''} {article.description or ''}")
+        if signature is None:
+            stories[article.story_id] = 1
+            continue
+        match = index.query(signature)
+        if match is not None:
+            article.story_id = match[0]
+        else:
+            index.insert(article.story_id, signature)
+        stories[article.story_id] = stories.get(article.story_id, 0) + 1
+    print(f"Grouped {len(articles)} articles into {len(stories)} stories.")
+    return stories
@@ -0,0 +1,116 @@
+import os
+import threading
+
+SPACY_MODEL = "en_core_web_sm"
+
+# Pipeline components none of our tasks use; keyword extraction needs only the
+# tagger (POS) and parser (noun chunks)
+EXCLUDED_COMPONENTS = ["ner", "lemmatizer"]
+
+# Texts per nlp.pipe batch and worker processes for bulk keyword extraction
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "256"))
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
+
+# NLTK data each task needs, as (resource path, download package)
+VADER_DATA = [("sentiment/vader_lexicon.zip", "vader_lexicon")]
+PREPROCESSING_DATA = [
+    ("tokenizers/punkt", "punkt"),
+    ("tokenizers/punkt_tab", "punkt_tab"),
+    ("corpora/stopwords", "stopwords"),
+    ("corpora/wordnet", "wordnet"),
+]
+
+class LazyResource:
+    """
+    A value built on first use and shared by every thread afterwards.
+
+    The factory runs at most once; concurrent first callers wait on a
+    lock instead of loading the resource twice.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def get(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._value = self._factory()
+                    self._loaded = True
+        return self._value
+
+_nltk_lock = threading.Lock()
+
+def ensure_nltk_data(resources):
+    """Download any of the given NLTK resources that are not installed yet."""
+    import nltk
+
+    with _nltk_lock:
+        for path, package in resources:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                nltk.download(package, quiet=True)
+
+def _load_spacy():
+    import spacy
+
+    try:
+        return spacy.load(SPACY_MODEL, exclude=EXCLUDED_COMPONENTS)
+    except OSError:
+        # If model not installed, download it
+        print("Downloading spaCy language model...")
+        os.system(f"python -m spacy download {SPACY_MODEL}")
+        return spacy.load(SPACY_MODEL, exclude=EXCLUDED_COMPONENTS)
+
+def _load_sia():
+    ensure_nltk_data(VADER_DATA)
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+def _load_lemmatizer():
+    ensure_nltk_data(PREPROCESSING_DATA)
+    from nltk.stem import WordNetLemmatizer
+    return WordNetLemmatizer()
+
+def _load_stop_words():
+    ensure_nltk_data(PREPROCESSING_DATA)
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words("english"))
+
+_nlp = LazyResource(_load_spacy)
+_sia = LazyResource(_load_sia)
+_lemmatizer = LazyResource(_load_lemmatizer)
+_stop_words = LazyResource(_load_stop_words)
+
+def get_nlp():
+    """Return the process-wide spaCy pipeline, loading it on first use."""
+    return _nlp.get()
+
+def get_sia():
+    """Return the shared VADER SentimentIntensityAnalyzer, fetching its lexicon on first use."""
+    return _sia.get()
+
+def get_lemmatizer():
+    """Return the shared WordNet lemmatizer used by preprocessing."""
+    return _lemmatizer.get()
+
+def get_stop_words():
+    """Return the English stopword set used by preprocessing."""
+    return _stop_words.get()
+
+def warm_up(preprocessing=False):
+    """
+    Load the analysis models now rather than on the first article.
+
+    Args:
+        preprocessing (bool): Also load the NLTK data and tools preprocessing uses
+    """
+    get_sia()
+    get_nlp()
+    if preprocessing:
+        get_lemmatizer()
+        get_stop_words()
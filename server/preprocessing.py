@@ -1,27 +1,15 @@
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
-import spacy
-import json
 
-# Download NLTK data
-nltk.download("punkt")
-nltk.download("stopwords")
-nltk.download("wordnet")
-
-# Load SpaCy model
-nlp = spacy.load("en_core_web_sm")
-
-# Initialize lemmatizer
-lemmatizer = WordNetLemmatizer()
-
-# Stopwords
-stop_words = set(stopwords.words("english"))
+from jsonl import read_jsonl, write_jsonl
+from nlp_models import get_lemmatizer, get_stop_words
 
 # Preprocessing function
 def preprocess_text(text):
+    # NLTK and its data are loaded on first use, not at import
+    from nltk.tokenize import word_tokenize
+    stop_words = get_stop_words()
+    lemmatizer = get_lemmatizer()
+    
     # 1. Lowercase
     text = text.lower()
     
@@ -45,18 +33,16 @@ def preprocess_text(text):
 
 # Preprocess articles
 def preprocess_articles(input_file, output_file):
-    with open(input_file, "r") as file:
-        articles = json.load(file)
-    
-    for article in articles:
-        # Preprocess title and description
-        article["title_cleaned"] = preprocess_text(article.get("title", ""))
-        article["description_cleaned"] = preprocess_text(article.get("description", ""))
-    
-    # Save preprocessed data
-    with open(output_file, "w") as file:
-        json.dump(articles, file, indent=4)
+    def preprocessed(articles):
+        for article in articles:
+            # Preprocess title and description
+            article["title_cleaned"] = preprocess_text(article.get("title") or "")
+            article["description_cleaned"] = preprocess_text(article.get("description") or "")
+            yield article
+    
+    # Stream preprocessed data, one record per line
+    write_jsonl(output_file, preprocessed(read_jsonl(input_file)))
     print(f"Preprocessed articles saved to {output_file}")
 
 if __name__ == "__main__":
-    preprocess_articles("../data/all_articles.json", "../data/preprocessed_articles.json")
+    preprocess_articles("../data/all_articles.jsonl", "../data/preprocessed_articles.jsonl")
@@ -0,0 +1,74 @@
+import os
+
+from api_scripts.rate_limit import remaining_quota
+from api_scripts.registry import SOURCES_BY_NAME
+from fetch_engine import fetch_all_sources
+
+# Topics searched on every query-based provider each cycle
+DEFAULT_QUERIES = ["technology"]
+
+# Enough workers that a provider waiting on its token bucket cannot starve the others
+FAN_OUT_MAX_WORKERS = 32
+
+def load_queries():
+    """Read the cycle's topic list from NEWS_QUERIES (comma separated), falling back to the defaults."""
+    queries = [query.strip() for query in os.getenv("NEWS_QUERIES", "").split(",") if query.strip()]
+    return queries or list(DEFAULT_QUERIES)
+
+def fan_out_queries(queries, query_fetchers, static_fetchers=None, cursors=None, max_workers=FAN_OUT_MAX_WORKERS):
+    """
+    Fan a list of queries out over every provider and merge the results per source.
+
+    Jobs are submitted query by query, so when daily quotas run short every
+    provider still gets the first topics before any provider gets the last.
+    Pacing and quota enforcement happen per request in the shared HTTP
+    client; a provider that runs out of quota simply contributes nothing
+    for its remaining queries.
+
+    With a cursor store, each query fetcher is asked only for articles
+    newer than its source/query high-water mark, and every batch (including
+    static sources such as RSS) is filtered against the mark, which then
+    advances. Marks are not persisted here; call ``cursors.save()`` once
+    the fetched articles have been fully processed.
+
+    Args:
+        queries (list): Search terms to run on each query-based provider
+        query_fetchers (dict): Source name -> callable taking a query and a ``since``
+            datetime (or None) and returning articles
+        static_fetchers (dict, optional): Source name -> zero-argument callable, run once per cycle
+        cursors (CursorStore, optional): High-water marks for incremental fetching
+        max_workers (int): Maximum number of fetch jobs in flight
+
+    Returns:
+        dict: Mapping of source name to the articles fetched across all queries
+    """
+    def incremental(source, query, fetch):
+        if cursors is None:
+            return fetch
+        spec = SOURCES_BY_NAME.get(source)
+        newest_first = bool(spec and spec.newest_first)
+        return lambda: cursors.filter_new(source, query, fetch(), newest_first=newest_first)
+
+    jobs = {}
+    for query in queries:
+        for source, fetch in query_fetchers.items():
+            since = cursors.get(source, query) if cursors else None
+            job = lambda fetch=fetch, query=query, since=since: fetch(query, since)
+            jobs[(source, query)] = incremental(source, query, job)
+    for source, fetch in (static_fetchers or {}).items():
+        jobs[(source, None)] = incremental(source, None, fetch)
+
+    fetched = fetch_all_sources(
+        {_job_name(source, query): job for (source, query), job in jobs.items()},
+        max_workers=max_workers,
+    )
+
+    merged = {source: [] for source in list(query_fetchers) + list(static_fetchers or {})}
+    for (source, query) in jobs:
+        merged[source].extend(fetched[_job_name(source, query)])
+
+    print(f"Remaining daily quota: {remaining_quota()}")
+    return merged
+
+def _job_name(source, query):
+    return source if query is None else f"{source} [{query}]"
@@ -0,0 +1,79 @@
+import os
+import threading
+
+import numpy as np
+
+from dedup import canonicalize_url, url_hash
+
+# Sorted little-endian uint64 URL hashes of every article already processed
+SEEN_URL_STORE_PATH = os.getenv("SEEN_URL_STORE", "./data/seen_urls.u64")
+
+# Hashes merged per step when new entries are written back, bounding save() memory
+MERGE_CHUNK = 1 << 20
+
+_DTYPE = np.dtype("<u8")
+
+class SeenUrlStore:
+    """
+    Persistent set of canonical URLs that have already been analyzed and uploaded.
+
+    The set is a sorted array of 64-bit URL hashes memory-mapped from disk,
+    so tens of millions of entries cost 8 bytes each on disk and only the
+    pages touched by binary search in memory. New URLs collect in a small
+    in-memory set until ``save`` merges them in, which, like the cursor
+    store, the pipeline calls only once a run has been fully processed.
+    """
+
+    def __init__(self, path=SEEN_URL_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._hashes = self._open()
+
+    def _open(self):
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= _DTYPE.itemsize:
+            return np.memmap(self.path, dtype=_DTYPE, mode="r")
+        return np.empty(0, dtype=_DTYPE)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._hashes) + len(self._pending)
+
+    def _stored(self, key):
+        position = np.searchsorted(self._hashes, key)
+        return position < len(self._hashes) and self._hashes[position] == key
+
+    def __contains__(self, url):
+        key = url_hash(canonicalize_url(url))
+        with self._lock:
+            return key in self._pending or self._stored(np.uint64(key))
+
+    def add(self, url):
+        key = url_hash(canonicalize_url(url))
+        with self._lock:
+            self._pending.add(key)
+
+    def save(self):
+        """Merge the pending hashes into the sorted file, chunk by chunk, and swap it in atomically."""
+        with self._lock:
+            if not self._pending:
+                return
+            pending = np.array(sorted(self._pending), dtype=_DTYPE)
+            if len(self._hashes):
+                positions = np.minimum(np.searchsorted(self._hashes, pending), len(self._hashes) - 1)
+                pending = pending[self._hashes[positions] != pending]
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as file:
+                start = 0
+                for offset in range(0, len(self._hashes), MERGE_CHUNK):
+                    chunk = np.asarray(self._hashes[offset:offset + MERGE_CHUNK])
+                    end = np.searchsorted(pending, chunk[-1], side="right")
+                    np.sort(np.concatenate((chunk, pending[start:end]))).tofile(file)
+                    start = end
+                pending[start:].tofile(file)
+            os.replace(tmp_path, self.path)
+
+            self._pending.clear()
+            self._hashes = self._open()